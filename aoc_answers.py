@@ -0,0 +1,196 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Persistent store of calculated answers
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from utils import CACHE_DIR, get_input_hash, get_input_path, get_source_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+_STORE_PATH = CACHE_DIR / "answers.json"
+
+
+@dataclass(frozen=True, kw_only=True)
+class StoredAnswer:
+    """
+    Attributes:
+        input_hash  (str)  : Hash of the input file the answer was calculated from
+        source_hash (str)  : Hash of the solution sources the answer was calculated by
+        seconds     (float): Wall time it took to calculate the answer
+        created     (str)  : ISO timestamp of when the answer was calculated
+    """
+
+    day: int
+    part: int
+    input_hash: str
+    source_hash: str
+    answer: str | int
+    seconds: float
+    created: str
+
+
+class AnswerStore:
+    """
+    Answers keyed by day, part, input hash and solution source hash.
+
+    Only one answer is kept per day and part. An answer becomes stale as soon as the
+      input or the solution sources change; stale answers are evicted when they are
+      looked up or replaced, and all of them can be evicted at once with `prune`.
+
+    Several runs may use the store at once. Saving locks the store, and applies the
+      answers put or evicted since it was loaded to what is stored now, so that the
+      answers of other runs are kept. Windows has no file locks, so there the last
+      run to save may lose the answers of runs saving at the same time.
+    """
+
+    path: Path
+    answers: dict[str, StoredAnswer]
+    # Answers put, or `None` if evicted, since the store was loaded or saved
+    _changes: dict[str, None | StoredAnswer]
+    _is_cleared: bool
+
+    def __init__(self, path: Path = _STORE_PATH) -> None:
+        self.path = path
+        self.answers = self._load()
+        self._changes = {}
+        self._is_cleared = False
+
+    def _load(self) -> dict[str, StoredAnswer]:
+        if not self.path.exists():
+            return {}
+        with self.path.open("r") as f:
+            raw_answers: list[dict[str, Any]] = json.load(f)
+        answers: dict[str, StoredAnswer] = {}
+        for raw_answer in raw_answers:
+            answer = StoredAnswer(**raw_answer)
+            answers[self._get_key(answer.day, answer.part)] = answer
+        return answers
+
+    @staticmethod
+    def _get_key(day: int, part: int) -> str:
+        return f"{day}:{part}"
+
+    def get(self, *, day: int, part: int) -> None | StoredAnswer:
+        """
+        Get the stored answer if it is still valid for the current input and sources.
+        """
+        key = self._get_key(day, part)
+        answer = self.answers.get(key)
+        if answer is None:
+            return None
+        if not self._is_valid(answer):
+            del self.answers[key]
+            self._changes[key] = None
+            self.save()
+            return None
+        return answer
+
+    def put(self, *, day: int, part: int, answer: str | int, seconds: float) -> None:
+        """
+        Store an answer calculated from the current input and sources, replacing any
+          previous answer for the day and part.
+        """
+        key = self._get_key(day, part)
+        self.answers[key] = self._changes[key] = StoredAnswer(
+            day=day,
+            part=part,
+            input_hash=get_input_hash(get_input_path(day)),
+            source_hash=get_source_hash(day),
+            answer=answer,
+            seconds=seconds,
+            created=datetime.now().isoformat(timespec="seconds"),
+        )
+        self.save()
+
+    def prune(self) -> int:
+        """
+        Evict all stale answers.
+        Returns:
+            (int): Number of answers evicted
+        """
+        stale_keys = [
+            key for key, answer in self.answers.items() if not self._is_valid(answer)
+        ]
+        for key in stale_keys:
+            del self.answers[key]
+            self._changes[key] = None
+        self.save()
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        self.answers = {}
+        self._changes = {}
+        self._is_cleared = True
+        self.save()
+
+    def save(self) -> None:
+        """
+        Apply the changes since the store was loaded to what is stored now, and write
+          the result.
+        """
+        # Only needed when saving, so not imported on every solve
+        import tempfile
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked():
+            answers = {} if self._is_cleared else self._load()
+            for key, answer in self._changes.items():
+                if answer is None:
+                    answers.pop(key, None)
+                else:
+                    answers[key] = answer
+            # Each writer needs a file of its own, as the lock is not always available
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(
+                        [asdict(answer) for answer in answers.values()], f, indent=2
+                    )
+                    f.write("\n")
+                tmp_path.replace(self.path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        self.answers = answers
+        self._changes = {}
+        self._is_cleared = False
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the store, where file locks are available.
+        """
+        if sys.platform == "win32":
+            # Concurrent runs may then lose each other's answers
+            yield
+            return
+        import fcntl
+
+        with self.path.with_suffix(".lock").open("w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _is_valid(answer: StoredAnswer) -> bool:
+        input_path = get_input_path(answer.day)
+        if not input_path.exists():
+            return False
+        return answer.input_hash == get_input_hash(
+            input_path
+        ) and answer.source_hash == get_source_hash(answer.day)
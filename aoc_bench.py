@@ -0,0 +1,474 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Benchmark solutions
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aoc_profile import MemoryTracker
+from utils import (
+    CACHE_DIR,
+    get_input_path,
+    get_solution,
+    get_solution_class,
+    get_solution_obj,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, Self
+
+    from aoc_profile import MemoryUsage, PartProfiler
+    from utils import PhaseTiming, PhaseTimings
+
+HISTORY_PATH = CACHE_DIR / "bench_history.jsonl"
+_ROOT_DIR = Path(__file__).resolve().parent
+STATS_PATH = _ROOT_DIR / "stats.md"
+# The generated performance section of `stats.md` is between these lines
+_STATS_START_LINE = "<!-- performance:start -->"
+_STATS_END_LINE = "<!-- performance:end -->"
+# Phases compared against the history. Reading only measures the file system
+_COMPARED_PHASES = ("parse", "solve")
+
+
+@dataclass(frozen=True, kw_only=True)
+class TimingStats:
+    """
+    Summary of timing samples, in seconds
+    """
+
+    min: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Self:
+        if not samples:
+            raise ValueError("Cannot summarize empty samples")
+        sorted_samples = sorted(samples)
+        # Nearest-rank percentile
+        p95_index = math.ceil(0.95 * len(sorted_samples)) - 1
+        return cls(
+            min=sorted_samples[0],
+            median=statistics.median(sorted_samples),
+            p95=sorted_samples[p95_index],
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class PhaseStats:
+    wall: TimingStats
+    cpu: TimingStats
+
+    @classmethod
+    def from_timings(cls, timings: list[PhaseTiming]) -> Self:
+        return cls(
+            wall=TimingStats.from_samples([timing.wall for timing in timings]),
+            cpu=TimingStats.from_samples([timing.cpu for timing in timings]),
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class PartBenchResult:
+    """
+    Attributes:
+        read   (PhaseStats)                    : Time spent reading the input file
+        parse  (PhaseStats)                    : Time spent in `_process_data`
+        solve  (PhaseStats)                    : Time spent in the part itself
+        memory (None | dict[str, MemoryUsage]): Memory used by reading and parsing
+                                                  (`parse`) and by the part (`solve`),
+                                                  if tracked
+    """
+
+    day: int
+    part: int
+    answer: None | str | int
+    warmup: int
+    repeat: int
+    read: PhaseStats
+    parse: PhaseStats
+    solve: PhaseStats
+    memory: None | dict[str, MemoryUsage] = None
+
+
+def bench_part(
+    *,
+    day: int,
+    part: int,
+    warmup: int,
+    repeat: int,
+    use_parse_cache: bool = False,
+    profiler: None | PartProfiler = None,
+    track_memory: bool = False,
+) -> PartBenchResult:
+    """
+    Benchmark one part of a day's solution.
+
+    A fresh solution object is constructed for every run so that caches held on the
+      object do not carry over between runs. If `profiler` is given, the part is
+      profiled in every non-warmup run, which slows it down. If `track_memory` is set,
+      memory is tracked in an extra untimed run before the others, so that caches
+      shared between runs are still cold.
+    """
+    if repeat < 1:
+        raise ValueError(f"{repeat=} must be at least 1")
+    memory = None
+    if track_memory:
+        # Imported beforehand so that the module is not counted as parsed data
+        get_solution_class(day)
+        tracker = MemoryTracker()
+        with tracker.measure("parse"):
+            solution_obj = get_solution_obj(day, use_parse_cache=use_parse_cache)
+        with tracker.measure("solve"):
+            get_solution(solution_obj, part)
+        memory = tracker.usages
+    runs: list[PhaseTimings] = []
+    answer = None
+    for i in range(warmup + repeat):
+        solution_obj = get_solution_obj(day, use_parse_cache=use_parse_cache)
+        if i < warmup:
+            get_solution(solution_obj, part)
+            continue
+        with nullcontext() if profiler is None else profiler.profiling():
+            answer = get_solution(solution_obj, part)
+        runs.append(solution_obj.timings)
+    solve_phase = "part_1" if part == 1 else "part_2"
+    return PartBenchResult(
+        day=day,
+        part=part,
+        answer=answer,
+        warmup=warmup,
+        repeat=repeat,
+        read=_get_phase_stats(runs, "read"),
+        parse=_get_phase_stats(runs, "parse"),
+        solve=_get_phase_stats(runs, solve_phase),
+        memory=memory,
+    )
+
+
+def _get_phase_stats(runs: list[PhaseTimings], phase: str) -> PhaseStats:
+    timings: list[PhaseTiming] = []
+    for run in runs:
+        timing: None | PhaseTiming = getattr(run, phase)
+        if timing is None:
+            raise ValueError(f"Phase {phase} was not run")
+        timings.append(timing)
+    return PhaseStats.from_timings(timings)
+
+
+def get_benchable_days() -> list[int]:
+    """
+    Get all days that have both a solution and a downloaded input.
+    """
+    return [
+        day
+        for day in range(1, 26)
+        if (input_path := get_input_path(day)).exists()
+        and (input_path.parent / "solution.py").exists()
+    ]
+
+
+def write_report(results: Iterable[PartBenchResult], path: Path) -> None:
+    """
+    Write benchmark results as a JSON report.
+    """
+    report: dict[str, Any] = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": [asdict(result) for result in results],
+    }
+    with path.open("w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+@dataclass(frozen=True, kw_only=True)
+class PhaseChange:
+    """
+    Attributes:
+        baseline (float): Median wall time of the phase in the history
+        current  (float): Median wall time of the phase in this run
+    """
+
+    day: int
+    part: int
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline <= 0:
+            return math.inf if self.current > 0 else 1.0
+        return self.current / self.baseline
+
+
+def append_history(
+    results: Iterable[PartBenchResult],
+    path: Path = HISTORY_PATH,
+    *,
+    profiled: bool,
+    parse_cache: bool,
+) -> None:
+    """
+    Append one record per benchmarked part to the JSON lines benchmark history, along
+      with the git commit and Python version it was run with, and whether it was
+      profiled or parsed from the parsed-input cache.
+    """
+    commit = get_git_commit()
+    dirty = is_git_dirty()
+    created = datetime.now().isoformat(timespec="seconds")
+    python = platform.python_version()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        for result in results:
+            record = {
+                "created": created,
+                "commit": commit,
+                "dirty": dirty,
+                "python": python,
+                "profiled": profiled,
+                "parse_cache": parse_cache,
+                **asdict(result),
+            }
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict[str, Any]]:
+    """
+    Load all benchmark history records, oldest first. Missing history has no records.
+    """
+    if not path.exists():
+        return []
+    with path.open("r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare_to_history(
+    results: Iterable[PartBenchResult],
+    *,
+    history: list[dict[str, Any]],
+    commit: str,
+    parse_cache: bool,
+) -> list[PhaseChange]:
+    """
+    Compare median wall times against the latest records of the same parts benchmarked
+      at a commit without uncommitted changes. Profiled records are slowed down by the
+      profiler, and only records that used the parsed-input cache the same way are
+      comparable. Parts without such a record are left out.
+    """
+    baselines: dict[tuple[int, int], dict[str, Any]] = {}
+    for record in history:
+        # Records from before the flags were stored were neither
+        if (
+            record["commit"] == commit
+            and not record["dirty"]
+            and not record.get("profiled", False)
+            and record.get("parse_cache", False) == parse_cache
+        ):
+            baselines[record["day"], record["part"]] = record
+    changes: list[PhaseChange] = []
+    for result in results:
+        baseline = baselines.get((result.day, result.part))
+        if baseline is None:
+            continue
+        for phase in _COMPARED_PHASES:
+            stats: PhaseStats = getattr(result, phase)
+            changes.append(
+                PhaseChange(
+                    day=result.day,
+                    part=result.part,
+                    phase=phase,
+                    baseline=baseline[phase]["wall"]["median"],
+                    current=stats.wall.median,
+                )
+            )
+    return changes
+
+
+def get_git_commit(ref: str = "HEAD") -> None | str:
+    """
+    Get the full hash of the commit a git ref points to, if git is available and the
+      ref exists.
+    """
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=_ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if process.returncode != 0:
+        return None
+    return process.stdout.strip()
+
+
+def is_git_dirty() -> bool:
+    """
+    Check whether tracked files have uncommitted changes. Untracked files, e.g.
+      inputs, are ignored.
+    """
+    try:
+        process = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=_ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return True
+    return process.returncode != 0 or bool(process.stdout.strip())
+
+
+def format_performance_section(
+    results: Iterable[PartBenchResult], *, commit: None | str
+) -> str:
+    """
+    Format the performance of each day as a markdown section for `stats.md`, with the
+      median wall time of parsing and of each part, and the peak traced memory.
+    """
+    day_results: dict[int, dict[int, PartBenchResult]] = {}
+    for result in results:
+        day_results.setdefault(result.day, {})[result.part] = result
+    rows: list[list[str]] = []
+    for day, part_results in sorted(day_results.items()):
+        parse_seconds = min(
+            result.parse.wall.median for result in part_results.values()
+        )
+        part_cells = [
+            ""
+            if part not in part_results
+            else _format_ms(part_results[part].solve.wall.median)
+            for part in (1, 2)
+        ]
+        peaks = [
+            peak
+            for result in part_results.values()
+            if (peak := _get_peak_memory(result)) is not None
+        ]
+        peak_cell = format_bytes(max(peaks)) if peaks else ""
+        rows.append([f"{day:>02}", _format_ms(parse_seconds), *part_cells, peak_cell])
+    table = _format_markdown_table(
+        ["Day", "Parse (ms)", "Level 1 (ms)", "Level 2 (ms)", "Peak Memory"], rows
+    )
+    commit_note = "" if commit is None else f" on commit `{commit[:12]}`"
+    return (
+        f"{_STATS_START_LINE}\n"
+        "## Performance by Day\n\n"
+        "Generated by `python run.py stats`"
+        f"{commit_note} with Python {platform.python_version()}.\n"
+        "Times are median wall times. Peak memory is the most memory traced by\n"
+        "tracemalloc while parsing and solving a part.\n\n"
+        f"{table}\n"
+        f"{_STATS_END_LINE}\n"
+    )
+
+
+def update_stats_file(section: str, path: Path = STATS_PATH) -> None:
+    """
+    Replace the generated performance section of `stats.md`, or append it if missing.
+    """
+    text = path.read_text()
+    start = text.find(_STATS_START_LINE)
+    end = text.find(_STATS_END_LINE)
+    if start == -1 or end == -1:
+        text = f"{text.rstrip()}\n\n{section}"
+    else:
+        rest = text[end + len(_STATS_END_LINE) :].removeprefix("\n")
+        text = text[:start] + section + rest
+    path.write_text(text)
+
+
+def _get_peak_memory(result: PartBenchResult) -> None | int:
+    """
+    Get the peak memory of parsing and solving a part, counting the parsed data that
+      is still alive while solving.
+    """
+    if result.memory is None:
+        return None
+    parse = result.memory["parse"]
+    solve = result.memory["solve"]
+    return max(parse.peak, parse.retained + solve.peak)
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1e3:.3f}"
+
+
+def _format_markdown_table(headers: list[str], rows: list[list[str]]) -> str:
+    """
+    Format a markdown table with padded columns. The first column is left-aligned, and
+      the others are centered, as in the tables written by hand in `stats.md`.
+    """
+    widths = [
+        max(len(cell) for cell in column) for column in zip(headers, *rows, strict=True)
+    ]
+
+    def format_row(cells: list[str]) -> str:
+        padded_cells = [
+            cell.ljust(width) if i == 0 else cell.center(width)
+            for i, (cell, width) in enumerate(zip(cells, widths, strict=True))
+        ]
+        return f"| {' | '.join(padded_cells)} |"
+
+    separators = [
+        f":{'-' * (width - 1)}" if i == 0 else f":{'-' * (width - 2)}:"
+        for i, width in enumerate(widths)
+    ]
+    lines = [format_row(headers), f"| {' | '.join(separators)} |"]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.3f} us"
+
+
+def format_bytes(size: int) -> str:
+    if abs(size) >= 1 << 20:
+        return f"{size / (1 << 20):.3f} MiB"
+    if abs(size) >= 1 << 10:
+        return f"{size / (1 << 10):.3f} KiB"
+    return f"{size} B"
+
+
+def format_stats(stats: TimingStats) -> str:
+    return (
+        f"min {format_seconds(stats.min)}, "
+        f"median {format_seconds(stats.median)}, "
+        f"p95 {format_seconds(stats.p95)}"
+    )
+
+
+def load_report_estimates(path: Path) -> dict[tuple[int, int], float]:
+    """
+    Get the estimated wall time of each day and part from a JSON report, including
+      reading and parsing the input. Missing reports give no estimates.
+    """
+    if not path.exists():
+        return {}
+    with path.open("r") as f:
+        report = json.load(f)
+    return {
+        (result["day"], result["part"]): sum(
+            result[phase]["wall"]["median"] for phase in ("read", "parse", "solve")
+        )
+        for result in report["results"]
+    }
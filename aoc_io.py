@@ -6,52 +6,173 @@ Get input from and submit answer to AOC
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from string import Template
 from time import sleep
 from typing import TYPE_CHECKING
 
-import requests
-import yaml
-from bs4 import BeautifulSoup
 from colorama import Fore, init
-from zoneinfo import ZoneInfo
 
-from utils import get_input_path
+from utils import get_day_dir, get_input_path
 
 if TYPE_CHECKING:
-    from typing import Literal
+    from typing import Any, Literal
+
+    from requests import Session
 
 init(autoreset=True)
 
+# `requests`, `yaml`, `bs4` and `zoneinfo` are slow to import, so they are imported on
+#   first use instead of at module level
+
 _CONFIG_PATH = Path(__file__).resolve().parent / "config.yml"
-with _CONFIG_PATH.open("r") as f:
-    _CONFIG = yaml.safe_load(f)
 
 _YEAR = 2023
-
-DATA_URL = Template(f"https://adventofcode.com/{_YEAR}/day/${{day}}/input")
-ANSWER_URL = Template(f"https://adventofcode.com/{_YEAR}/day/${{day}}/answer")
-
-_COOKIES = _CONFIG["cookies"]
+# Can be overridden with `base_url` in `config.yml`, e.g. to test against a local server
+_DEFAULT_BASE_URL = "https://adventofcode.com"
 
 _DAY_CHOICES = set(range(1, 26))
 _LEVEL_CHOICES = {1, 2}
 
+_ATTEMPTS = 3
+_BACKOFF_SECONDS = 1.0
+_TIMEOUT_SECONDS = 30.0
+_DEFAULT_JOBS = 4
+# Connections kept open to the server, enough for `download_all` not to reconnect
+_POOL_SIZE = 8
+
+
+@cache
+def _get_config() -> dict[str, Any]:
+    import yaml
+
+    with _CONFIG_PATH.open("r") as f:
+        return yaml.safe_load(f)
+
+
+def _get_cookies() -> dict[str, str]:
+    return _get_config()["cookies"]
+
+
+def _get_base_url() -> str:
+    return str(_get_config().get("base_url", _DEFAULT_BASE_URL)).rstrip("/")
+
+
+def _get_data_url(day: int) -> str:
+    return f"{_get_base_url()}/{_YEAR}/day/{day}/input"
+
+
+def _get_answer_url(day: int) -> str:
+    return f"{_get_base_url()}/{_YEAR}/day/{day}/answer"
+
+
+@cache
+def _get_session() -> Session:
+    """
+    Get the session shared by all requests, which keeps connections to the server open
+      between them.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.cookies.update(_get_cookies())
+    adapter = HTTPAdapter(pool_maxsize=_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _request(
+    method: Literal["GET", "POST"],
+    url: str,
+    *,
+    data: None | dict[str, Any] = None,
+    label: str,
+) -> bytes:
+    """
+    Send a request, retrying failures with exponential backoff.
+    Args:
+        method (GET, POST)            : HTTP method
+        url    (str)                  : URL to send the request to
+        data   (None | dict[str, Any]): Form data of the request
+        label  (str)                  : What the request is for, to print in messages
+    Returns:
+        (bytes): Body of the successful response
+    """
+    import requests
+
+    session = _get_session()
+    for attempt in range(_ATTEMPTS):
+        retry_after = None
+        try:
+            with session.request(
+                method, url, data=data, timeout=_TIMEOUT_SECONDS
+            ) as response:
+                if response.ok:
+                    return response.content
+                message = response.content.decode("utf-8", "replace").strip()
+                retry_after = response.headers.get("Retry-After")
+        except requests.RequestException as e:
+            message = str(e)
+        print(f"{Fore.RED}{label}: {message}")
+        if attempt == _ATTEMPTS - 1:
+            break
+        delay = _BACKOFF_SECONDS * 2**attempt
+        # The server may ask for a longer wait, e.g. when rate limited
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        sleep(delay)
+    raise ConnectionError(f"{label} failed!")
+
+
+def _get_unlock_time(day: int) -> datetime:
+    """
+    Get the local time the puzzle of a day opens, with one extra second just to be sure.
+    """
+    from zoneinfo import ZoneInfo
+
+    unlock_time_est = datetime(_YEAR, 12, day, 0, 0, 1, tzinfo=ZoneInfo("EST"))
+    return datetime.fromtimestamp(unlock_time_est.timestamp())
+
 
-def download_input(day: int, input_path: None | Path = None) -> None:
+def _is_valid_input(data: bytes) -> bool:
     """
-    Download input from AOC website.
+    Check that data looks like a puzzle input rather than a partial download or an
+      error page.
+    """
+    return data.endswith(b"\n") and not data.lstrip().startswith(b"<")
+
+
+def _has_valid_input(input_path: Path) -> bool:
+    try:
+        data = input_path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return _is_valid_input(data)
+
+
+def download_input(
+    day: int, input_path: None | Path = None, *, force: bool = False
+) -> bool:
+    """
+    Download input from AOC website, unless it is already downloaded.
     Args:
         day        (1..25)       : The day of AOC
         input_path (pathlib.Path): Path of file to write input to
+        force      (bool)        : Whether to download even if the file has an input
+    Returns:
+        (bool): Whether the input was downloaded
     """
     if day not in _DAY_CHOICES:
         raise ValueError(f"{day=} is not in range 1..25")
-    # One extra second just to be sure
-    target_time_est = datetime(_YEAR, 12, day, 0, 0, 1, tzinfo=ZoneInfo("EST"))
-    target_time_local = datetime.fromtimestamp(target_time_est.timestamp())
+    if input_path is None:
+        input_path = get_input_path(day)
+    if not force and _has_valid_input(input_path):
+        print(f"{Fore.CYAN}Input of day {day} is already at {input_path}")
+        return False
 
+    target_time_local = _get_unlock_time(day)
     while (now := datetime.now()) < target_time_local:
         diff = target_time_local - now
         seconds = max(diff.days * 86400 + diff.seconds, 0)
@@ -59,25 +180,59 @@ def download_input(day: int, input_path: None | Path = None) -> None:
         sleep(1)
     print("\r\x1b[K", end="")
 
-    for _ in range(3):
-        with requests.get(DATA_URL.substitute(day=day), cookies=_COOKIES) as response:
-            data = response.content
-            if not response.ok:
-                print(Fore.RED + data.decode("utf-8").strip())
-                sleep(5)
-                continue
-            break
-    else:
-        raise ConnectionError("Download failed!")
-
+    data = _request("GET", _get_data_url(day), label=f"Download of day {day}")
+    if not _is_valid_input(data):
+        raise ValueError(f"Downloaded input of day {day} is malformed: {data[:80]!r}")
     print(
-        Fore.GREEN
-        + f"Got input with {len(data)} characters and {len(data.splitlines())} lines"
+        Fore.GREEN + f"Got input of day {day} with {len(data)} characters and"
+        f" {len(data.splitlines())} lines"
     )
-    if input_path is None:
-        input_path = get_input_path(day)
     with input_path.open("wb") as input_fp:
         input_fp.write(data)
+    return True
+
+
+def download_all(*, jobs: None | int = None, force: bool = False) -> list[int]:
+    """
+    Download the inputs of all opened days that have a directory but no input,
+      several at a time. Days that are not opened yet are skipped instead of waited for.
+    Args:
+        jobs  (None | int): Maximum number of concurrent downloads
+        force (bool)      : Whether to download inputs that are already downloaded
+    Returns:
+        (list[int]): Days whose inputs were downloaded
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    now = datetime.now()
+    days = [
+        day
+        for day in sorted(_DAY_CHOICES)
+        if get_day_dir(day).is_dir()
+        and _get_unlock_time(day) <= now
+        and (force or not _has_valid_input(get_input_path(day)))
+    ]
+    if not days:
+        print(f"{Fore.CYAN}All inputs are already downloaded")
+        return []
+    downloaded_days: list[int] = []
+    failed_days: list[int] = []
+    with ThreadPoolExecutor(max_workers=jobs or _DEFAULT_JOBS) as executor:
+        futures = {
+            day: executor.submit(download_input, day, force=force) for day in days
+        }
+        for day, future in futures.items():
+            try:
+                if future.result():
+                    downloaded_days.append(day)
+            except (ConnectionError, ValueError) as e:
+                print(f"{Fore.RED}{e}")
+                failed_days.append(day)
+    if failed_days:
+        raise ConnectionError(
+            f"Failed to download days {', '.join(map(str, failed_days))}"
+        )
+    return downloaded_days
 
 
 def submit_output(day: int, part: Literal[1, 2], answer: str | int) -> None:
@@ -90,25 +245,19 @@ def submit_output(day: int, part: Literal[1, 2], answer: str | int) -> None:
     Returns:
         (str): Success/failure string, with coloring
     """
+    from bs4 import BeautifulSoup
+
     if day not in _DAY_CHOICES:
         raise ValueError(f"{day=} is not in range 1..25")
     if part not in _LEVEL_CHOICES:
         raise ValueError(f"{part=} is not 1 or 2")
 
-    for _ in range(3):
-        with requests.post(
-            ANSWER_URL.substitute(day=day),
-            {"level": part, "answer": answer},
-            cookies=_COOKIES,
-        ) as response:
-            data = response.content
-            if not response.ok:
-                print(Fore.RED + data.decode("utf-8").strip())
-                sleep(1)
-                continue
-            break
-    else:
-        raise ConnectionError("Failed to submit response.")
+    data = _request(
+        "POST",
+        _get_answer_url(day),
+        data={"level": part, "answer": answer},
+        label=f"Submission of day {day} part {part}",
+    )
 
     html = BeautifulSoup(data, "html.parser")
     try:
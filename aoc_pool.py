@@ -0,0 +1,166 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Run solutions in parallel
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from time import perf_counter, process_time
+from typing import TYPE_CHECKING
+
+from utils import get_solution, get_solution_class, get_solution_obj
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@dataclass(frozen=True, kw_only=True)
+class PartRunResult:
+    """
+    Attributes:
+        wall (float): Wall time of the task in the worker, including parsing
+        cpu  (float): CPU time of the task in the worker, including parsing
+        error (None | str): Description of the exception raised by the task, if any
+    """
+
+    day: int
+    part: int
+    answer: None | str | int
+    wall: float
+    cpu: float
+    error: None | str = None
+
+
+def run_parts_parallel(
+    tasks: list[tuple[int, int]],
+    *,
+    estimates: dict[tuple[int, int], float],
+    max_workers: None | int = None,
+    use_parse_cache: bool = False,
+) -> Iterator[PartRunResult]:
+    """
+    Run each (day, part) task in a process pool, yielding results as they finish.
+
+    Tasks are submitted longest-first by `estimates` so that long tasks do not end up
+      running alone at the end. Tasks without an estimate are assumed to be the longest.
+    """
+    # Import in the parent so that forked workers start with the modules loaded
+    for day in sorted({day for day, _ in tasks}):
+        # Tasks of a day that fails to import report the error themselves
+        with suppress(Exception):
+            get_solution_class(day)
+    ordered_tasks = sorted(
+        tasks, key=lambda task: estimates.get(task, math.inf), reverse=True
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _run_part, day=day, part=part, use_parse_cache=use_parse_cache
+            )
+            for day, part in ordered_tasks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _run_part(*, day: int, part: int, use_parse_cache: bool) -> PartRunResult:
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    answer = error = None
+    try:
+        solution_obj = get_solution_obj(day, use_parse_cache=use_parse_cache)
+        answer = get_solution(solution_obj, part)
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+    return PartRunResult(
+        day=day,
+        part=part,
+        answer=answer,
+        wall=perf_counter() - wall_start,
+        cpu=process_time() - cpu_start,
+        error=error,
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class InputPartResult:
+    """
+    Attributes:
+        input   (str)       : Path of the input file
+        seconds (float)     : Wall time of the part, excluding reading and parsing
+        error   (None | str): Description of the exception raised, if any
+    """
+
+    input: str
+    part: int
+    answer: None | str | int
+    seconds: float
+    error: None | str = None
+
+    def as_dict(self) -> dict[str, None | str | int | float]:
+        d = asdict(self)
+        if self.error is None:
+            del d["error"]
+        return d
+
+
+def run_inputs_parallel(
+    day: int,
+    input_paths: list[Path],
+    *,
+    parts: list[int],
+    max_workers: None | int = None,
+) -> Iterator[InputPartResult]:
+    """
+    Solve many inputs of a day in a process pool, yielding results of each input as
+      they finish. Each input is parsed once and shared by all of its parts, and each
+      worker imports the solution module once and reuses it across inputs.
+    """
+    get_solution_class(day)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=get_solution_class, initargs=(day,)
+    ) as executor:
+        futures = [
+            executor.submit(_run_input, day=day, input_path=input_path, parts=parts)
+            for input_path in input_paths
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _run_input(
+    *, day: int, input_path: Path, parts: list[int]
+) -> list[InputPartResult]:
+    try:
+        solution_obj = get_solution_class(day)(input_path=input_path)
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+        return [
+            InputPartResult(
+                input=str(input_path), part=part, answer=None, seconds=0.0, error=error
+            )
+            for part in parts
+        ]
+    results: list[InputPartResult] = []
+    for part in parts:
+        start = perf_counter()
+        answer = error = None
+        try:
+            answer = get_solution(solution_obj, part)
+        except Exception as err:
+            error = f"{type(err).__name__}: {err}"
+        results.append(
+            InputPartResult(
+                input=str(input_path),
+                part=part,
+                answer=answer,
+                seconds=perf_counter() - start,
+                error=error,
+            )
+        )
+    return results
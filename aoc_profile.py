@@ -0,0 +1,377 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Profile solutions
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from utils import CACHE_DIR
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import FrameType, TracebackType
+    from typing import Self
+
+    type _Func = tuple[str, int, str]
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+# Call paths that take less time than this are left out of collapsed stacks
+_MIN_PATH_SECONDS = 1e-6
+_SAMPLE_INTERVAL_SECONDS = 0.01
+_STATM_PATH = Path("/proc/self/statm")
+# Allocations that are not made by the code being measured
+_IGNORED_TRACE_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+]
+
+
+class PartProfiler:
+    """
+    cProfile profiler of a part. Can be enabled several times, e.g. once per benchmark
+      run, to accumulate results.
+    """
+
+    profile: cProfile.Profile
+
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def write(self, *, day: int, part: int, output_dir: Path) -> tuple[Path, Path]:
+        """
+        Write the cProfile stats and the collapsed stacks of the part.
+        Returns:
+            (pathlib.Path): Path of the `.prof` file
+            (pathlib.Path): Path of the collapsed stack file
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        name = f"day_{day:>02}_part_{part}"
+        prof_path = output_dir / f"{name}.prof"
+        collapsed_path = output_dir / f"{name}.collapsed.txt"
+        self.profile.dump_stats(prof_path)
+        collapsed_path.write_text(get_collapsed_stacks(pstats.Stats(self.profile)))
+        return prof_path, collapsed_path
+
+
+def get_collapsed_stacks(stats: pstats.Stats) -> str:
+    """
+    Convert profile stats to the collapsed stack format used by flame graph tools, i.e.
+      one `root;...;leaf microseconds` line per call path.
+
+    cProfile only records caller-callee pairs, so the time of a function is split
+      between its call paths in proportion to the time spent under each caller.
+      Recursive calls are folded into the outermost call.
+    """
+    # pstats.Stats.stats: {func: (prim_calls, calls, self_time, cum_time, callers)}
+    raw_stats: dict[_Func, tuple[int, int, float, float, dict[_Func, tuple]]] = (
+        stats.stats  # pyright: ignore[reportAttributeAccessIssue]
+    )
+    callees: defaultdict[_Func, list[_Func]] = defaultdict(list)
+    for func, (*_, callers) in raw_stats.items():
+        for caller in callers:
+            callees[caller].append(func)
+
+    collapsed: Counter[str] = Counter()
+
+    def walk(func: _Func, path: list[_Func], path_seconds: float) -> None:
+        _, _, self_seconds, cum_seconds, _ = raw_stats[func]
+        if cum_seconds <= 0:
+            return
+        scale = path_seconds / cum_seconds
+        path.append(func)
+        self_us = round(self_seconds * scale * 1e6)
+        if self_us > 0:
+            collapsed[";".join(map(_get_func_label, path))] += self_us
+        for callee in callees[func]:
+            if callee in path:
+                continue
+            edge_cum_seconds = raw_stats[callee][4][func][3]
+            callee_path_seconds = edge_cum_seconds * scale
+            if callee_path_seconds >= _MIN_PATH_SECONDS:
+                walk(callee, path, callee_path_seconds)
+        path.pop()
+
+    for func, (*_, cum_seconds, callers) in raw_stats.items():
+        if not callers:
+            walk(func, [], cum_seconds)
+    return "".join(f"{stack} {us}\n" for stack, us in sorted(collapsed.items()))
+
+
+def _get_func_label(func: _Func) -> str:
+    filename, lineno, func_name = func
+    # Built-ins have no file
+    if filename == "~":
+        return func_name
+    return f"{Path(filename).stem}:{lineno}({func_name})"
+
+
+@dataclass(frozen=True, kw_only=True)
+class FrameSamples:
+    """
+    Attributes:
+        label       (str): Function of the frame, as in collapsed stacks
+        own_count   (int): Number of samples in which the function was running itself
+        total_count (int): Number of samples in which the function was on the stack
+    """
+
+    label: str
+    own_count: int
+    total_count: int
+
+
+class StackSampler:
+    """
+    Sampler of the stack of the thread that enters it, run in a background thread.
+      Only frames called from the frame that enters the sampler are recorded.
+
+    Unlike cProfile, sampling adds little overhead and its results can be read while
+      the sampled code is still running, e.g. when it is aborted.
+    """
+
+    interval: float
+    sample_count: int
+    own_counts: Counter[_Func]
+    total_counts: Counter[_Func]
+    _root_frame: None | FrameType
+    _thread_id: int
+    _stopped: threading.Event
+    _sampling_thread: None | threading.Thread
+
+    def __init__(self, *, interval: float = _SAMPLE_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self.sample_count = 0
+        self.own_counts = Counter()
+        self.total_counts = Counter()
+        self._root_frame = None
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._sampling_thread = None
+
+    def __enter__(self) -> Self:
+        self._root_frame = sys._getframe(1)
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._sampling_thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampling_thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: None | type[BaseException],
+        exc_value: None | BaseException,
+        traceback: None | TracebackType,
+    ) -> None:
+        self._stopped.set()
+        if self._sampling_thread is not None:
+            self._sampling_thread.join()
+        self._sampling_thread = None
+        self._root_frame = None
+
+    def _sample_loop(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._sample(frame)
+
+    def _sample(self, frame: FrameType) -> None:
+        funcs: list[_Func] = []
+        curr_frame = frame
+        while curr_frame is not None and curr_frame is not self._root_frame:
+            code = curr_frame.f_code
+            funcs.append((code.co_filename, code.co_firstlineno, code.co_name))
+            curr_frame = curr_frame.f_back
+        # Not called from the root frame, e.g. the sampled code has not started yet
+        if curr_frame is None or not funcs:
+            return
+        self.sample_count += 1
+        self.own_counts[funcs[0]] += 1
+        # Recursive functions count once per sample
+        self.total_counts.update(set(funcs))
+
+    def get_hottest_frames(self, top: int = 10) -> list[FrameSamples]:
+        """
+        Get the functions that were running themselves in the most samples.
+        """
+        funcs = sorted(
+            self.total_counts,
+            key=lambda func: (self.own_counts[func], self.total_counts[func]),
+            reverse=True,
+        )
+        return [
+            FrameSamples(
+                label=_get_func_label(func),
+                own_count=self.own_counts[func],
+                total_count=self.total_counts[func],
+            )
+            for func in funcs[:top]
+        ]
+
+
+class PartTimeoutError(TimeoutError):
+    pass
+
+
+@contextmanager
+def time_limit(seconds: float) -> Iterator[None]:
+    """
+    Raise `PartTimeoutError` in the main thread if the body runs for longer than
+      `seconds`. The error can only be raised between Python bytecodes, so a single
+      long-running built-in call is not interrupted until it returns.
+    """
+    if not hasattr(signal, "SIGALRM"):
+        raise RuntimeError(
+            "Time limits need SIGALRM, which this platform does not have"
+        )
+
+    def handle_alarm(signum: int, frame: None | FrameType) -> None:
+        raise PartTimeoutError(f"Did not finish in {seconds} seconds")
+
+    prev_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, prev_handler)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AllocationSite:
+    """
+    Attributes:
+        location (str): `dir/file.py:line` where the memory was allocated
+        size     (int): Bytes allocated at the site during the phase and still alive
+        count    (int): Number of memory blocks making up `size`
+    """
+
+    location: str
+    size: int
+    count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class MemoryUsage:
+    """
+    Attributes:
+        peak      (int)                 : Highest traced memory during the phase, in
+                                            bytes above the memory at its start
+        retained  (int)                 : Traced memory allocated during the phase and
+                                            still alive at its end, in bytes
+        rss_delta (None | int)          : Change of the resident set size, excluding
+                                            tracemalloc's own memory. `None` where it
+                                            cannot be read
+        top_sites (list[AllocationSite]): Sites with the most retained memory
+    """
+
+    peak: int
+    retained: int
+    rss_delta: None | int
+    top_sites: list[AllocationSite]
+
+
+class MemoryTracker:
+    """
+    Memory usage of consecutive phases, e.g. parsing and a part, tracked by tracemalloc.
+      Tracing slows Python down considerably, so phases should not be timed while their
+      memory is tracked.
+    """
+
+    top: int
+    usages: dict[str, MemoryUsage]
+
+    def __init__(self, *, top: int = 5) -> None:
+        self.top = top
+        self.usages = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            start_snapshot = tracemalloc.take_snapshot()
+            start_rss = _get_rss()
+            start_overhead = tracemalloc.get_tracemalloc_memory()
+            # Taken after the snapshot so that it is not counted in the phase
+            start_traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            yield
+            end_traced, peak_traced = tracemalloc.get_traced_memory()
+            end_overhead = tracemalloc.get_tracemalloc_memory()
+            end_rss = _get_rss()
+            end_snapshot = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        rss_delta = None
+        if start_rss is not None and end_rss is not None:
+            rss_delta = end_rss - start_rss - (end_overhead - start_overhead)
+        self.usages[phase] = MemoryUsage(
+            peak=peak_traced - start_traced,
+            retained=end_traced - start_traced,
+            rss_delta=rss_delta,
+            top_sites=self._get_top_sites(start_snapshot, end_snapshot),
+        )
+
+    def _get_top_sites(
+        self, start_snapshot: tracemalloc.Snapshot, end_snapshot: tracemalloc.Snapshot
+    ) -> list[AllocationSite]:
+        diffs = end_snapshot.filter_traces(_IGNORED_TRACE_FILTERS).compare_to(
+            start_snapshot.filter_traces(_IGNORED_TRACE_FILTERS), "lineno"
+        )
+        diffs = sorted(
+            (diff for diff in diffs if diff.size_diff > 0),
+            key=lambda diff: diff.size_diff,
+            reverse=True,
+        )
+        top_sites: list[AllocationSite] = []
+        for diff in diffs[: self.top]:
+            frame = diff.traceback[0]
+            path = Path(frame.filename)
+            # Keep the parent directory to tell the days' `solution.py` apart
+            file_label = (
+                path.name
+                if path.parent == path.parent.parent
+                else path.relative_to(path.parent.parent).as_posix()
+            )
+            top_sites.append(
+                AllocationSite(
+                    location=f"{file_label}:{frame.lineno}",
+                    size=diff.size_diff,
+                    count=diff.count_diff,
+                )
+            )
+        return top_sites
+
+
+def _get_rss() -> None | int:
+    """
+    Get the resident set size of this process in bytes, if `/proc` is available.
+    """
+    try:
+        resident_pages = int(_STATM_PATH.read_text().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
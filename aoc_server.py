@@ -0,0 +1,190 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Solve parts in a long-running process that keeps solutions parsed
+
+Requests and responses are single lines of JSON over a Unix socket. A request is
+  `{"day": 1, "part": 1, "input_path": null}`, or `{"command": "stop"}` to stop the
+  server. A response is `{"answer": ..., "parsed": ..., "timings": ...}`, or
+  `{"error": ...}` if the part could not be solved
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from utils import (
+    CACHE_DIR,
+    get_input_hash,
+    get_input_path,
+    get_solution,
+    get_solution_obj,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from utils import SolutionAbstract
+
+SOCKET_PATH = CACHE_DIR / "serve.sock"
+
+
+@dataclass(frozen=True, kw_only=True)
+class _WarmSolution:
+    """
+    Attributes:
+        solution_obj (SolutionAbstract): Solution object with the input parsed
+        mtime_ns     (int)             : Modification time of the input when it was
+                                           last checked
+        size         (int)             : Size of the input when it was last checked
+        input_hash   (str)             : Hash of the parsed input
+    """
+
+    solution_obj: SolutionAbstract
+    mtime_ns: int
+    size: int
+    input_hash: str
+
+
+class _SolverServer(socketserver.UnixStreamServer):
+    """
+    Server that keeps a parsed solution object per day and input file. Solutions are
+      not thread-safe, so requests are handled one at a time.
+    """
+
+    warm_solutions: dict[tuple[int, Path], _WarmSolution]
+    stopping: bool
+
+    def __init__(self, socket_path: Path) -> None:
+        self.warm_solutions = {}
+        self.stopping = False
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        day = int(request["day"])
+        part = int(request["part"])
+        raw_input_path: None | str = request.get("input_path")
+        input_path = (
+            get_input_path(day) if raw_input_path is None else Path(raw_input_path)
+        )
+        solution_obj, parsed = self._get_solution_obj(day, input_path)
+        answer = get_solution(solution_obj, part)
+        return {
+            "answer": answer,
+            "parsed": parsed,
+            "timings": solution_obj.timings.as_dict(),
+        }
+
+    def _get_solution_obj(
+        self, day: int, input_path: Path
+    ) -> tuple[SolutionAbstract, bool]:
+        """
+        Get the warm solution object of an input, parsing it again only if the input
+          changed since it was parsed
+        Returns:
+            (SolutionAbstract): Solution object with the input parsed
+            (bool)            : Whether the input was parsed for this request
+        """
+        key = (day, input_path.resolve())
+        stat = input_path.stat()
+        warm_solution = self.warm_solutions.get(key)
+        if warm_solution is not None and (
+            warm_solution.mtime_ns == stat.st_mtime_ns
+            and warm_solution.size == stat.st_size
+        ):
+            return warm_solution.solution_obj, False
+        input_hash = get_input_hash(input_path)
+        # Touched, but not changed
+        if warm_solution is not None and warm_solution.input_hash == input_hash:
+            self.warm_solutions[key] = replace(
+                warm_solution, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+            )
+            return warm_solution.solution_obj, False
+        solution_obj = get_solution_obj(day, input_path=input_path)
+        self.warm_solutions[key] = _WarmSolution(
+            solution_obj=solution_obj,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            input_hash=input_hash,
+        )
+        return solution_obj, True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _SolverServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            response: dict[str, Any]
+            try:
+                request: dict[str, Any] = json.loads(line)
+                if request.get("command") == "stop":
+                    self.server.stopping = True
+                    response = {"stopped": True}
+                else:
+                    response = self.server.solve(request)
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.stopping:
+                return
+
+
+def serve(socket_path: Path = SOCKET_PATH) -> None:
+    """
+    Serve requests until a stop request is received.
+
+    Solution modules are imported once, so the server has to be restarted to pick up
+      changes to solutions.
+    """
+    _check_unix_sockets()
+    if socket_path.exists():
+        if _is_serving(socket_path):
+            raise RuntimeError(f"A server is already listening on {socket_path}")
+        # Left behind by a server that did not exit cleanly
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with _SolverServer(socket_path) as server:
+            while not server.stopping:
+                server.handle_request()
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+def send_request(
+    request: dict[str, Any], socket_path: Path = SOCKET_PATH
+) -> dict[str, Any]:
+    """
+    Send one request to a running server and wait for its response.
+    Raises:
+        ConnectionError: If no server is listening on the socket
+    """
+    _check_unix_sockets()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"No server is listening on {socket_path}") from e
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def _is_serving(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _check_unix_sockets() -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix sockets are not supported on this platform")
@@ -0,0 +1,145 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Compare day 01 part 2 with the slicing scan it used to do, on lines of growing length
+
+Run from the repository root with `python -m benchmarks.day_01_scaling`. Every input
+  has about `--total` characters, split into lines of each length in `--lengths`. The
+  digits of a line are in its middle, surrounded by letters that are in no digit word,
+  which is the worst case of both scans. The automaton takes time linear in the input
+  size, so its time stays flat as lines get longer, while the slicing scan is
+  quadratic in the line length
+"""
+
+from __future__ import annotations
+
+import random
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from aoc_bench import format_seconds
+from utils import get_solution, get_solution_obj
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+_WORD_MAP = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+}
+# Letters that are in no digit word
+_FILLER_CHARS = "abcdjklmpqyz"
+
+
+def _main() -> None:
+    args = _get_args()
+    print(
+        f"{'length':>10}  {'lines':>8}  {'automaton':>12}  {'MB/s':>8}  {'slicing':>12}"
+    )
+    rng = random.Random(args.seed)
+    with TemporaryDirectory() as temp_dir:
+        input_path = Path(temp_dir) / "input.txt"
+        for length in args.lengths:
+            line_count = max(args.total // length, 1)
+            rows = [_get_row(rng, length) for _ in range(line_count)]
+            input_path.write_text("\n".join(rows) + "\n")
+            solution_obj = get_solution_obj(1, input_path=input_path)
+            answer = get_solution(solution_obj, 2)
+            part_timing = solution_obj.timings.part_2
+            if part_timing is None:
+                raise ValueError("Solution was not timed")
+            automaton_seconds = part_timing.wall
+            throughput = line_count * length / automaton_seconds / 1e6
+            slicing_cell = "skipped"
+            if length <= args.max_slicing_length:
+                start = perf_counter()
+                slicing_answer = _get_slicing_sum(rows)
+                slicing_cell = format_seconds(perf_counter() - start)
+                if slicing_answer != answer:
+                    raise ValueError(f"Answers differ: {answer} != {slicing_answer}")
+            print(
+                f"{length:>10}  {line_count:>8}"
+                f"  {format_seconds(automaton_seconds):>12}"
+                f"  {throughput:>8.2f}  {slicing_cell:>12}"
+            )
+
+
+def _get_args() -> Namespace:
+    parser = ArgumentParser(description="Benchmark day 01 part 2 on long lines")
+    parser.add_argument(
+        "-l",
+        "--lengths",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000, 100000, 1000000],
+    )
+    parser.add_argument("-n", "--total", type=int, default=4_000_000)
+    parser.add_argument("--max-slicing-length", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def _get_row(rng: random.Random, length: int) -> str:
+    digits = rng.choice(list(_WORD_MAP)) + rng.choice("123456789")
+    filler_length = max(length - len(digits), 0)
+    before = filler_length // 2
+    filler = rng.choices(_FILLER_CHARS, k=filler_length)
+    return "".join(filler[:before]) + digits + "".join(filler[before:])
+
+
+def _get_slicing_sum(rows: list[str]) -> int:
+    """
+    Part 2 as it was solved before the automaton, slicing off a character at a time
+      and checking every word at each position
+    """
+    sum_ = 0
+    for row in rows:
+        first_digit = None
+        first_row = row
+        while first_row:
+            first_digit = _check_starting_digit(first_row)
+            if first_digit is not None:
+                break
+            first_row = first_row[1:]
+        last_digit = None
+        last_row = row
+        while last_row:
+            last_digit = _check_ending_digit(last_row)
+            if last_digit is not None:
+                break
+            last_row = last_row[:-1]
+        if first_digit is None or last_digit is None:
+            raise ValueError(f"Cannot find digits in row {row}")
+        sum_ += int(first_digit + last_digit)
+    return sum_
+
+
+def _check_starting_digit(s: str) -> None | str:
+    if s[0].isdigit():
+        return s[0]
+    for word, char in _WORD_MAP.items():
+        if s.startswith(word):
+            return char
+    return None
+
+
+def _check_ending_digit(s: str) -> None | str:
+    if s[-1].isdigit():
+        return s[-1]
+    for word, char in _WORD_MAP.items():
+        if s.endswith(word):
+            return char
+    return None
+
+
+if __name__ == "__main__":
+    _main()
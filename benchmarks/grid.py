@@ -0,0 +1,115 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Compare `grid.Grid` with the tuples of 1-character strings the grid-based days used to
+  store their grids in
+
+Run from the repository root with `python -m benchmarks.grid --size 140`. The grid is
+  a generated day 14 platform. Memory is measured with tracemalloc, and each operation
+  is timed as the minimum of several runs
+"""
+
+from __future__ import annotations
+
+import random
+import tracemalloc
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from aoc_bench import format_bytes, format_seconds
+from grid import Grid
+from utils import get_generator
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Callable
+    from typing import Any
+
+    type _Tuple2D = tuple[tuple[str, ...], ...]
+
+
+def _main() -> None:
+    args = _get_args()
+    rows = get_generator(14)(args.size, seed=args.seed).splitlines()
+    rng = random.Random(args.seed)
+    coords = [
+        (rng.randrange(args.size), rng.randrange(args.size)) for _ in range(10_000)
+    ]
+    tuple_grid = _get_tuple_grid(rows)
+    grid = Grid.from_rows(rows)
+
+    print(f"{args.size}x{args.size} grid")
+    print(f"{'':<24}{'tuples':>14}{'Grid':>14}")
+    tuple_size = _get_allocated_size(lambda: _get_tuple_grid(rows))
+    grid_size = _get_allocated_size(lambda: Grid.from_rows(rows))
+    print(f"{'memory':<24}{format_bytes(tuple_size):>14}{format_bytes(grid_size):>14}")
+    operations: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        ("construct", lambda: _get_tuple_grid(rows), lambda: Grid.from_rows(rows)),
+        (
+            "read 10000 cells",
+            lambda: [tuple_grid[r][c] for r, c in coords],
+            lambda: [grid[coord] for coord in coords],
+        ),
+        (
+            "iterate cells",
+            lambda: sum(1 for row in tuple_grid for cell in row if cell == "O"),
+            lambda: sum(1 for _, cell in grid.iter_cells() if cell == "O"),
+        ),
+        (
+            "transpose",
+            lambda: tuple(zip(*tuple_grid, strict=True)),
+            grid.transpose,
+        ),
+        (
+            "transposed rows",
+            lambda: tuple(map("".join, zip(*tuple_grid, strict=True))),
+            lambda: grid.transpose().get_rows(),
+        ),
+        ("hash", lambda: hash(tuple_grid), lambda: hash(grid)),
+    ]
+    for name, tuple_operation, grid_operation in operations:
+        tuple_seconds = _time(tuple_operation, repeat=args.repeat)
+        grid_seconds = _time(grid_operation, repeat=args.repeat)
+        print(
+            f"{name:<24}{format_seconds(tuple_seconds):>14}"
+            f"{format_seconds(grid_seconds):>14}"
+        )
+
+
+def _get_args() -> Namespace:
+    parser = ArgumentParser(description="Benchmark Grid against tuples of strings")
+    parser.add_argument("-n", "--size", type=int, default=140)
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def _get_tuple_grid(rows: list[str]) -> _Tuple2D:
+    return tuple(map(tuple, rows))
+
+
+def _get_allocated_size(construct: Callable[[], Any]) -> int:
+    """
+    Get the memory still allocated by an object after constructing it
+    """
+    tracemalloc.start()
+    try:
+        obj = construct()
+        size, _ = tracemalloc.get_traced_memory()
+        del obj
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def _time(operation: Callable[[], Any], *, repeat: int) -> float:
+    walls: list[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        operation()
+        walls.append(perf_counter() - start)
+    return min(walls)
+
+
+if __name__ == "__main__":
+    _main()
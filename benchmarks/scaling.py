@@ -0,0 +1,89 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Measure how a part's parse and solve times scale with the size of generated inputs
+
+Run from the repository root with
+  `python -m benchmarks.scaling <day> <part> --sizes 10 100 1000`. Inputs are made by
+  the day's `generator.py`. The growth exponent is estimated between consecutive sizes,
+  e.g. 1 for linear and 2 for quadratic time
+"""
+
+from __future__ import annotations
+
+import math
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from aoc_bench import format_seconds
+from utils import get_generator, get_solution, get_solution_obj
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+
+def _main() -> None:
+    args = _get_args()
+    generate = get_generator(args.day)
+    print(f"{'size':>10}  {'parse':>12}  {'solve':>12}  {'exponent':>8}  answer")
+    prev_size = prev_total = None
+    with TemporaryDirectory() as temp_dir:
+        input_path = Path(temp_dir) / "input.txt"
+        for size in args.sizes:
+            input_path.write_text(generate(size, seed=args.seed))
+            parse, solve, answer = _measure(
+                day=args.day, part=args.part, input_path=input_path, repeat=args.repeat
+            )
+            total = parse + solve
+            exponent = ""
+            if prev_size is not None and prev_total is not None and prev_total > 0:
+                exponent = (
+                    f"{math.log(total / prev_total) / math.log(size / prev_size):.2f}"
+                )
+            print(
+                f"{size:>10}  {format_seconds(parse):>12}  {format_seconds(solve):>12}"
+                f"  {exponent:>8}  {answer!r}"
+            )
+            prev_size, prev_total = size, total
+
+
+def _get_args() -> Namespace:
+    parser = ArgumentParser(description="Benchmark scaling with generated inputs")
+    parser.add_argument("day", type=int, choices=range(1, 26))
+    parser.add_argument("part", type=int, choices=(1, 2))
+    parser.add_argument(
+        "-s", "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000]
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def _measure(
+    *, day: int, part: int, input_path: Path, repeat: int
+) -> tuple[float, float, None | str | int]:
+    """
+    Solve an input several times with fresh solution objects
+    Returns:
+        (float)            : Minimum wall time of parsing
+        (float)            : Minimum wall time of the part
+        (None | str | int): Answer of the part
+    """
+    parse_walls: list[float] = []
+    solve_walls: list[float] = []
+    answer = None
+    for _ in range(repeat):
+        solution_obj = get_solution_obj(day, input_path=input_path)
+        answer = get_solution(solution_obj, part)
+        timings = solution_obj.timings
+        part_timing = timings.part_1 if part == 1 else timings.part_2
+        if timings.parse is None or part_timing is None:
+            raise ValueError("Solution was not timed")
+        parse_walls.append(timings.parse.wall)
+        solve_walls.append(part_timing.wall)
+    return min(parse_walls), min(solve_walls), answer
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,116 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Measure the start-up overhead of `python run.py p <day> <part>`
+
+Run from the repository root with `python -m benchmarks.startup <day> <part>`. Exits
+  with a non-zero status if a module that should only be imported lazily is imported,
+  or if the import time exceeds the budget given with `--max-import-ms`
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only needed to download inputs or submit answers
+_LAZY_MODULES = {"requests", "yaml", "bs4", "zoneinfo"}
+
+
+def _main() -> None:
+    args = _get_args()
+    print_cmd = ["run.py", "p", str(args.day), str(args.part)]
+    baseline_walls: list[float] = []
+    run_walls: list[float] = []
+    import_times: list[dict[str, int]] = []
+    for _ in range(args.repeat):
+        baseline_walls.append(_run(["-c", "pass"])[0])
+        wall, import_time = _run(print_cmd)
+        run_walls.append(wall)
+        import_times.append(import_time)
+
+    baseline_wall = statistics.median(baseline_walls)
+    run_wall = statistics.median(run_walls)
+    median_import_times = {
+        module: statistics.median(times)
+        for module, times in _transpose(import_times).items()
+    }
+    total_import_ms = sum(median_import_times.values()) / 1e3
+    print(f"Interpreter start-up: {baseline_wall * 1e3:.1f} ms")
+    print(f"Print command       : {run_wall * 1e3:.1f} ms")
+    print(f"Overhead            : {(run_wall - baseline_wall) * 1e3:.1f} ms")
+    print(f"Total import time   : {total_import_ms:.1f} ms")
+    print("Slowest imports (self time):")
+    slowest = sorted(median_import_times.items(), key=lambda item: -item[1])
+    for module, self_us in slowest[: args.top]:
+        print(f"  {self_us / 1e3:>8.2f} ms  {module}")
+
+    failed = False
+    imported_lazy_modules = {
+        module.split(".", 1)[0] for module in median_import_times
+    } & _LAZY_MODULES
+    if imported_lazy_modules:
+        print(f"Modules imported eagerly: {', '.join(sorted(imported_lazy_modules))}")
+        failed = True
+    if args.max_import_ms is not None and total_import_ms > args.max_import_ms:
+        print(f"Import time exceeds budget of {args.max_import_ms} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+def _get_args() -> Namespace:
+    parser = ArgumentParser(description="Benchmark run.py start-up")
+    parser.add_argument("day", type=int, choices=range(1, 26))
+    parser.add_argument("part", type=int, choices=(1, 2))
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-n", "--top", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float)
+    return parser.parse_args()
+
+
+def _run(cmd: list[str]) -> tuple[float, dict[str, int]]:
+    """
+    Run a Python command with `-X importtime`
+    Returns:
+        (float)         : Wall time of the whole process
+        (dict[str, int]): Self import time of each module, in microseconds
+    """
+    start = perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *cmd],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = perf_counter() - start
+    import_time: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        import_time[module.strip()] = int(self_us)
+    return wall, import_time
+
+
+def _transpose(import_times: list[dict[str, int]]) -> dict[str, list[int]]:
+    transposed: defaultdict[str, list[int]] = defaultdict(list)
+    for import_time in import_times:
+        for module, self_us in import_time.items():
+            transposed[module].append(self_us)
+    return transposed
+
+
+if __name__ == "__main__":
+    _main()
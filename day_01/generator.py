@@ -0,0 +1,39 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+import string
+
+_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 01 input.
+    Args:
+        size (int): Number of calibration lines
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows: list[str] = []
+    for _ in range(size):
+        tokens: list[str] = []
+        for _ in range(rng.randint(1, 8)):
+            match rng.randrange(3):
+                case 0:
+                    tokens.append(rng.choice(string.digits[1:]))
+                case 1:
+                    tokens.append(rng.choice(_WORDS))
+                case _:
+                    tokens.append(
+                        "".join(
+                            rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))
+                        )
+                    )
+        # Part 1 needs at least one digit on every line
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(string.digits[1:]))
+        rows.append("".join(tokens))
+    return "\n".join(rows) + "\n"
@@ -2,22 +2,168 @@
 
 from __future__ import annotations
 
-from utils import SolutionAbstract
+import string
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from utils import STDIN_PATH, SolutionAbstract
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Self
+
+_WORD_MAP = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+}
+_DIGIT_MAP = {digit: digit for digit in string.digits}
+# Bytes removed from a line to leave only its digits
+_NON_DIGIT_BYTES = bytes(byte for byte in range(256) if chr(byte) not in string.digits)
+
+
+@dataclass(frozen=True, kw_only=True)
+class _DigitAutomaton:
+    """
+    Aho-Corasick automaton of digit patterns, with every transition resolved, so that
+      a line is scanned one character at a time without ever going back.
+
+    No pattern occurs inside another, so the first pattern to end is also the first
+      to start.
+
+    Patterns are either strings, scanned a character at a time, or bytes, scanned a
+      byte value at a time.
+
+    Attributes:
+        transitions (list[dict[str | int, int]]): Next state by character, per state.
+                                                    Characters missing lead to state 0
+        digits      (list[None | str])          : Digit of the pattern ending at each
+                                                    state, if any
+    """
+
+    transitions: list[dict[str | int, int]]
+    digits: list[None | str]
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[tuple[str | bytes, str]]) -> Self:
+        """
+        Construct an automaton matching patterns to their digits.
+        """
+        pattern_map = dict(patterns)
+        # Trie of the patterns
+        transitions: list[dict[str | int, int]] = [{}]
+        digits: list[None | str] = [None]
+        for pattern, digit in pattern_map.items():
+            state = 0
+            for char in pattern:
+                if char not in transitions[state]:
+                    transitions[state][char] = len(transitions)
+                    transitions.append({})
+                    digits.append(None)
+                state = transitions[state][char]
+            digits[state] = digit
+        # Resolve missing transitions through the failure links, breadth-first so
+        #   that shallower states are resolved first
+        failures = [0] * len(transitions)
+        alphabet = {char for pattern in pattern_map for char in pattern}
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            if digits[state] is None:
+                digits[state] = digits[failure]
+            for char in alphabet:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    transitions[state][char] = transitions[failure].get(char, 0)
+                else:
+                    failures[next_state] = transitions[failure].get(char, 0)
+                    queue.append(next_state)
+        # Transitions back to the root are the default
+        for state_transitions in transitions:
+            for char, next_state in list(state_transitions.items()):
+                if not next_state:
+                    del state_transitions[char]
+        return cls(transitions=transitions, digits=digits)
+
+    def find_first(self, chars: Iterable[str | int]) -> None | str:
+        """
+        Get the digit of the first pattern in the characters, if any.
+        """
+        transitions = self.transitions
+        digits = self.digits
+        state = 0
+        for char in chars:
+            state = transitions[state].get(char, 0)
+            digit = digits[state]
+            if digit is not None:
+                return digit
+        return None
+
+
+_FORWARD_AUTOMATON = _DigitAutomaton.from_patterns((_WORD_MAP | _DIGIT_MAP).items())
+# Scans lines from the end
+_BACKWARD_AUTOMATON = _DigitAutomaton.from_patterns(
+    (pattern[::-1], digit) for pattern, digit in (_WORD_MAP | _DIGIT_MAP).items()
+)
+_FORWARD_BYTES_AUTOMATON = _DigitAutomaton.from_patterns(
+    (pattern.encode(), digit) for pattern, digit in (_WORD_MAP | _DIGIT_MAP).items()
+)
+_BACKWARD_BYTES_AUTOMATON = _DigitAutomaton.from_patterns(
+    (pattern[::-1].encode(), digit)
+    for pattern, digit in (_WORD_MAP | _DIGIT_MAP).items()
+)
+
+
+def get_calibration_sums(lines: Iterable[bytes]) -> tuple[None | int, None | int]:
+    """
+    Get the sums of both parts in a single pass through the lines, e.g. of a binary
+      file, holding only one line at a time. As with `raw_data`, only blank lines at
+      the end are ignored, and other lines without digits leave no sums.
+    Args:
+        lines (Iterable[bytes]): Lines of the input, with or without line endings
+    Returns:
+        (None | int): Part 1 sum, or `None` if a line has no digit
+        (None | int): Part 2 sum, or `None` if a line has no digit or digit word
+    """
+    part_1_sum: None | int = 0
+    part_2_sum: None | int = 0
+    has_blank_line = False
+    for line in lines:
+        if not line.rstrip(b"\r\n"):
+            has_blank_line = True
+            continue
+        if has_blank_line:
+            # A blank line before this one is not at the end
+            part_1_sum = part_2_sum = None
+        first_digit = _FORWARD_BYTES_AUTOMATON.find_first(line)
+        if first_digit is None:
+            part_1_sum = part_2_sum = None
+            continue
+        # The automata are reversed through, so the line is never copied for them
+        last_digit = _BACKWARD_BYTES_AUTOMATON.find_first(reversed(line))
+        if last_digit is None:
+            raise ValueError(f"Line {line!r} has a first digit but no last digit")
+        if part_2_sum is not None:
+            part_2_sum += int(first_digit + last_digit)
+        digits = line.translate(None, _NON_DIGIT_BYTES)
+        if not digits:
+            part_1_sum = None
+        elif part_1_sum is not None:
+            part_1_sum += int(chr(digits[0]) + chr(digits[-1]))
+    return part_1_sum, part_2_sum
 
 
 class Solution(SolutionAbstract, day=1):
     data: list[str]
-    _WORD_MAP = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-    }
 
     def _process_data(self, raw_data: list[str]) -> None:
         """
@@ -51,45 +197,48 @@ class Solution(SolutionAbstract, day=1):
         """
         sum_ = 0
         for row in self.data:
-            first_digit = None
-            first_row = row
-            while first_row:
-                first_digit = self._part_2_check_starting_digit(first_row)
-                if first_digit is not None:
-                    break
-                first_row = first_row[1:]
-            last_digit = None
-            last_row = row
-            while last_row:
-                last_digit = self._part_2_check_ending_digit(last_row)
-                if last_digit is not None:
-                    break
-                last_row = last_row[:-1]
+            first_digit = _FORWARD_AUTOMATON.find_first(row)
+            last_digit = _BACKWARD_AUTOMATON.find_first(reversed(row))
             if first_digit is None or last_digit is None:
                 raise ValueError(f"Cannot find digits in row {row}")
             sum_ += int(first_digit + last_digit)
         return sum_
 
-    @classmethod
-    def _part_2_check_starting_digit(cls, s: str) -> None | str:
+
+class StreamingSolution(Solution, day=1):
+    """
+    Day 01 solution that solves both parts while reading the input a line at a time,
+      so that its memory use does not grow with the input. Used with `--stream`.
+    """
+
+    calibration_sums: tuple[None | int, None | int]
+
+    def _read_input(self) -> None:
+        # The input is read while it is processed
+        pass
+
+    def _process_input(self) -> None:
+        path = self._get_input_path()
+        if path == STDIN_PATH:
+            self.calibration_sums = get_calibration_sums(sys.stdin.buffer)
+            return
+        with path.open("rb") as f:
+            self.calibration_sums = get_calibration_sums(f)
+
+    def part_1(self, *, visualize: bool = False) -> int:
         """
-        Check if the string has a starting digit for part 2
+        Day 01 part 1 solution, from the sums computed while reading the input.
         """
-        if s[0].isdigit():
-            return s[0]
-        for word, char in cls._WORD_MAP.items():
-            if s.startswith(word):
-                return char
-        return None
+        part_1_sum, _ = self.calibration_sums
+        if part_1_sum is None:
+            raise ValueError("Cannot find digits in some rows")
+        return part_1_sum
 
-    @classmethod
-    def _part_2_check_ending_digit(cls, s: str) -> None | str:
+    def part_2(self, *, visualize: bool = False) -> int:
         """
-        Check if the string has a ending digit for part 2
+        Day 01 part 2 solution, from the sums computed while reading the input.
         """
-        if s[-1].isdigit():
-            return s[-1]
-        for word, char in cls._WORD_MAP.items():
-            if s.endswith(word):
-                return char
-        return None
+        _, part_2_sum = self.calibration_sums
+        if part_2_sum is None:
+            raise ValueError("Cannot find digits in some rows")
+        return part_2_sum
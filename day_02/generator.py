@@ -0,0 +1,29 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_COLORS = ["red", "green", "blue"]
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 02 input.
+    Args:
+        size (int): Number of games
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows: list[str] = []
+    for game_id in range(1, size + 1):
+        reveal_strs: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(_COLORS, k=rng.randint(1, len(_COLORS)))
+            reveal_strs.append(
+                ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+            )
+        rows.append(f"Game {game_id}: {'; '.join(reveal_strs)}")
+    return "\n".join(rows) + "\n"
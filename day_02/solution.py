@@ -2,76 +2,283 @@
 
 from __future__ import annotations
 
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from utils import SolutionAbstract
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Self
 
+    type _Cubes = tuple[int, int, int]
+
+# In lowercase input, either a count of cubes of a color followed by a separator and
+#   another count or by the end of the row, the start of a game, the end of a row, or
+#   any other text, which is invalid
+_TOKEN_PATTERN = re.compile(
+    r"(\d+) (red|green|blue)(?:[,;](?= *\d)| *(?=\n|\Z))|game (\d+):|(\n)|(\S+)"
+)
+# Fewer bags than this are answered by scanning the groups for each bag, which is
+#   faster than building the trees of the sweep
+_MIN_SWEPT_LIMIT_COUNT = 128
+
 
 @dataclass(frozen=True, kw_only=True)
-class _Game:
-    id: int
-    reveals: list[_CubeReveal]
+class _GameTable:
+    """
+    Games as columns, holding only the most cubes of each color revealed at once in
+      each game, which is all both parts need.
+
+    Attributes:
+        ids        (array[int]): ID of each game
+        max_reds   (array[int]): Most red cubes revealed at once in each game
+        max_greens (array[int]): Most green cubes revealed at once in each game
+        max_blues  (array[int]): Most blue cubes revealed at once in each game
+    """
+
+    ids: array[int]
+    max_reds: array[int]
+    max_greens: array[int]
+    max_blues: array[int]
 
     @classmethod
-    def from_str(cls, s: str) -> Self:
-        id_str, reveals_str = s.lower().removeprefix("game").split(":")
-        id_ = int(id_str.strip())
-        reveals = [
-            _CubeReveal.from_str(s.strip()) for s in reveals_str.strip().split(";")
+    def from_rows(cls, rows: list[str]) -> Self:
+        ids = array("Q")
+        max_counts = {"red": array("Q"), "green": array("Q"), "blue": array("Q")}
+        row_index = 0
+        is_row_start = True
+        # Unmatched groups are empty strings
+        for count_str, color, id_str, newline, invalid in _TOKEN_PATTERN.findall(
+            "\n".join(rows).lower()
+        ):
+            if is_row_start:
+                if not id_str:
+                    raise ValueError(
+                        f"Row {rows[row_index]!r} does not start with a game ID"
+                    )
+                ids.append(int(id_str))
+                for color_max_counts in max_counts.values():
+                    color_max_counts.append(0)
+                is_row_start = False
+                continue
+            if newline:
+                row_index += 1
+                is_row_start = True
+                continue
+            if not count_str:
+                raise ValueError(f"Invalid reveal in row {rows[row_index]!r}")
+            color_max_counts = max_counts[color]
+            count = int(count_str)
+            if count > color_max_counts[-1]:
+                color_max_counts[-1] = count
+        return cls(
+            ids=ids,
+            max_reds=max_counts["red"],
+            max_greens=max_counts["green"],
+            max_blues=max_counts["blue"],
+        )
+
+    def get_possible_ids(self, *, red: int, green: int, blue: int) -> list[int]:
+        """
+        Get the IDs of the games that are possible with a bag of the given cubes.
+        """
+        return [
+            id_
+            for id_, max_red, max_green, max_blue in zip(
+                self.ids, self.max_reds, self.max_greens, self.max_blues, strict=True
+            )
+            if max_red <= red and max_green <= green and max_blue <= blue
+        ]
+
+    def get_powers(self) -> list[int]:
+        """
+        Get the power of the fewest cubes that make each game possible.
+        """
+        return [
+            max_red * max_green * max_blue
+            for max_red, max_green, max_blue in zip(
+                self.max_reds, self.max_greens, self.max_blues, strict=True
+            )
         ]
-        return cls(id=id_, reveals=reveals)
 
 
 @dataclass(frozen=True, kw_only=True)
-class _CubeReveal:
-    red: int
-    green: int
-    blue: int
+class _MaximaIndex:
+    """
+    Games grouped by their color maxima, sorted by red, to answer many bag limits at
+      once. A game is possible with a bag iff the bag dominates its maxima, i.e. has
+      at least as many cubes of every color.
+
+    Attributes:
+        reds        (list[int])      : Red maximum of each group, in ascending order
+        green_ranks (list[int])      : 1-based rank of each group's green maximum in
+                                         `greens`
+        blues       (list[int])      : Blue maximum of each group
+        id_sums     (list[int])      : Sum of the IDs of the games in each group
+        greens      (list[int])      : Distinct green maxima, in ascending order
+        node_blues  (list[list[int]]): Blue maxima of the groups under each node of a
+                                         Fenwick tree over green ranks, in ascending
+                                         order. Node 0 is unused
+    """
+
+    reds: list[int]
+    green_ranks: list[int]
+    blues: list[int]
+    id_sums: list[int]
+    greens: list[int]
+    node_blues: list[list[int]]
 
     @classmethod
-    def from_str(cls, s: str) -> Self:
-        cube_strs = [ss.strip() for ss in s.split(",")]
-        counts = {"red": 0, "green": 0, "blue": 0}
-        for cube_str in cube_strs:
-            cube_count_str, cube_type_str = cube_str.split()
-            counts[cube_type_str] = int(cube_count_str)
-        return cls(**counts)
+    def from_table(cls, games: _GameTable) -> Self:
+        id_sums: Counter[_Cubes] = Counter()
+        for id_, red, green, blue in zip(
+            games.ids, games.max_reds, games.max_greens, games.max_blues, strict=True
+        ):
+            id_sums[red, green, blue] += id_
+        groups = sorted(id_sums.items())
+        greens = sorted({green for (_, green, _), _ in groups})
+        green_rank_map = {green: rank for rank, green in enumerate(greens, start=1)}
+        green_ranks = [green_rank_map[green] for (_, green, _), _ in groups]
+        blues = [blue for (_, _, blue), _ in groups]
+        # Each group is under O(log(greens)) nodes, so nodes hold O(groups log) blues
+        node_blues: list[list[int]] = [[] for _ in range(len(greens) + 1)]
+        for green_rank, blue in zip(green_ranks, blues, strict=True):
+            i = green_rank
+            while i < len(node_blues):
+                node_blues[i].append(blue)
+                i += i & -i
+        for blues_of_node in node_blues:
+            blues_of_node.sort()
+        return cls(
+            reds=[red for (red, _, _), _ in groups],
+            green_ranks=green_ranks,
+            blues=blues,
+            id_sums=[id_sum for _, id_sum in groups],
+            greens=greens,
+            node_blues=node_blues,
+        )
+
+    def get_possible_id_sums(self, limits: Sequence[_Cubes]) -> list[int]:
+        """
+        Get the sum of the IDs of the games possible with each bag.
+
+        Bags are answered in order of red cubes, while adding the groups with at most
+          that many red cubes to a Fenwick tree over green ranks, whose nodes are
+          Fenwick trees over the blue maxima of their groups. The sum of a bag is then
+          the prefix sum up to its green and blue cubes. Adding a group or answering a
+          bag takes O(log^2(groups)) time, and the trees take O(groups log(groups))
+          space however large the counts are.
+        Args:
+            limits (Sequence[tuple[int, int, int]]): Red, green and blue cubes of bags
+        Returns:
+            (list[int]): Sum of the IDs of the possible games, per bag
+        """
+        if len(limits) < _MIN_SWEPT_LIMIT_COUNT:
+            return [self._get_scanned_id_sum(limit) for limit in limits]
+        trees = [[0] * (len(node) + 1) for node in self.node_blues]
+        id_sums = [0] * len(limits)
+        group_count = len(self.reds)
+        group_index = 0
+        for limit_index in sorted(range(len(limits)), key=lambda i: limits[i][0]):
+            red, green, blue = limits[limit_index]
+            while group_index < group_count and self.reds[group_index] <= red:
+                self._add(
+                    trees,
+                    self.green_ranks[group_index],
+                    self.blues[group_index],
+                    self.id_sums[group_index],
+                )
+                group_index += 1
+            id_sums[limit_index] = self._get_prefix_sum(
+                trees, bisect_right(self.greens, green), blue
+            )
+        return id_sums
+
+    def _get_scanned_id_sum(self, limit: _Cubes) -> int:
+        red, green, blue = limit
+        group_count = bisect_right(self.reds, red)
+        green_rank = bisect_right(self.greens, green)
+        return sum(
+            id_sum
+            for group_green_rank, group_blue, id_sum in zip(
+                self.green_ranks[:group_count],
+                self.blues[:group_count],
+                self.id_sums[:group_count],
+                strict=True,
+            )
+            if group_green_rank <= green_rank and group_blue <= blue
+        )
+
+    def _add(
+        self, trees: list[list[int]], green_rank: int, blue: int, value: int
+    ) -> None:
+        i = green_rank
+        while i < len(trees):
+            tree = trees[i]
+            # Equal blues share the first slot of their run
+            j = bisect_left(self.node_blues[i], blue) + 1
+            while j < len(tree):
+                tree[j] += value
+                j += j & -j
+            i += i & -i
+
+    def _get_prefix_sum(
+        self, trees: list[list[int]], green_rank: int, blue: int
+    ) -> int:
+        sum_ = 0
+        i = green_rank
+        while i:
+            tree = trees[i]
+            j = bisect_right(self.node_blues[i], blue)
+            while j:
+                sum_ += tree[j]
+                j -= j & -j
+            i -= i & -i
+        return sum_
 
 
 class Solution(SolutionAbstract, day=2):
-    games: list[_Game]
+    games: _GameTable
 
     def _process_data(self, raw_data: list[str]) -> None:
         """
         Process day 02 data.
         """
-        self.games = [_Game.from_str(row) for row in raw_data]
+        self.games = _GameTable.from_rows(raw_data)
+
+    @cached_property
+    def maxima_index(self) -> _MaximaIndex:
+        """
+        Index of the games for many bags at once, built on first use, as part 2 does
+          not need it.
+        """
+        return _MaximaIndex.from_table(self.games)
+
+    def get_possible_id_sums(self, limits: Sequence[_Cubes]) -> list[int]:
+        """
+        Get the sum of the IDs of the games possible with each of many bags.
+        Args:
+            limits (Sequence[tuple[int, int, int]]): Red, green and blue cubes of bags
+        Returns:
+            (list[int]): Sum of the IDs of the possible games, per bag
+        """
+        return self.maxima_index.get_possible_id_sums(limits)
 
     def part_1(self, *, visualize: bool = False) -> int:
         """
         Day 02 part 1 solution.
         """
-        sum_ = 0
-        for game in self.games:
-            for reveal in game.reveals:
-                if reveal.red > 12 or reveal.green > 13 or reveal.blue > 14:
-                    break
-            else:
-                sum_ += game.id
-        return sum_
+        [id_sum] = self.get_possible_id_sums([(12, 13, 14)])
+        return id_sum
 
     def part_2(self, *, visualize: bool = False) -> int:
         """
         Day 02 part 2 solution.
         """
-        sum_ = 0
-        for game in self.games:
-            red = max(reveal.red for reveal in game.reveals)
-            green = max(reveal.green for reveal in game.reveals)
-            blue = max(reveal.blue for reveal in game.reveals)
-            sum_ += red * green * blue
-        return sum_
+        return sum(self.games.get_powers())
@@ -0,0 +1,34 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_SYMBOLS = "*#+$/@%=&-"
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 03 input.
+    Args:
+        size (int): Width and height of the schematic
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows: list[str] = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.1:
+                # Keep numbers apart so that they are not read as one
+                row += str(rng.randint(1, 999)) + "."
+            elif roll < 0.15:
+                # Gears are the most common symbol
+                row += "*" if rng.random() < 0.4 else rng.choice(_SYMBOLS)
+            else:
+                row += "."
+        rows.append(row[:size])
+    return "\n".join(rows) + "\n"
@@ -2,96 +2,133 @@
 
 from __future__ import annotations
 
+import re
+from array import array
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from grid import Grid
 from utils import SolutionAbstract
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from utils import InputBuffer
 
     type _Coord = tuple[int, int]
 
+_NUMBER_PATTERN = re.compile(rb"\d+")
+_SYMBOL_PATTERN = re.compile(rb"[^\d.]")
+
 
 @dataclass(frozen=True, kw_only=True)
-class _Schematic:
-    data: list[list[str]]
-    row_count: int = field(init=False)
-    col_count: int = field(init=False)
+class _Number:
+    """
+    Attributes:
+        value     (int): Value of the number
+        row       (int): Row the number is on
+        col_start (int): Column of the first digit
+        col_end   (int): Column after the last digit
+    """
 
-    def __post_init__(self) -> None:
-        object.__setattr__(self, "row_count", len(self.data))
-        object.__setattr__(self, "col_count", len(self.data[0]))
+    value: int
+    row: int
+    col_start: int
+    col_end: int
 
-    def __getitem__(self, index: _Coord) -> str:
-        row, col = index
-        return self.data[row][col]
 
-    def iter_cells(self) -> Iterable[tuple[_Coord, str]]:
-        for r, row in enumerate(self.data):
-            for c, cell in enumerate(row):
-                yield (r, c), cell
+@dataclass(frozen=True, kw_only=True)
+class _Schematic:
+    """
+    Schematic with every number labelled once, so that the number covering a cell is
+      looked up instead of being read from the grid again.
+
+    Attributes:
+        grid       (Grid)                    : Cells of the schematic
+        numbers    (list[_Number])           : Numbers, in reading order
+        number_ids (array[int])              : Index in `numbers` of the number
+                                                 covering each cell, row by row, or -1
+        symbols    (list[tuple[_Coord, str]]): Symbols and their coordinates, in
+                                                 reading order
+    """
+
+    grid: Grid
+    numbers: list[_Number] = field(init=False)
+    number_ids: array[int] = field(init=False)
+    symbols: list[tuple[_Coord, str]] = field(init=False)
 
-    def iter_adjacent_coords(self, coord: _Coord) -> Iterable[_Coord]:
+    def __post_init__(self) -> None:
+        col_count = self.grid.col_count
+        numbers: list[_Number] = []
+        number_ids = array("i", [-1]) * (self.grid.row_count * col_count)
+        symbols: list[tuple[_Coord, str]] = []
+        for r, row in enumerate(self.grid.get_rows()):
+            offset = r * col_count
+            for match in _NUMBER_PATTERN.finditer(row):
+                c_start, c_end = match.span()
+                number_ids[offset + c_start : offset + c_end] = array(
+                    "i", [len(numbers)]
+                ) * (c_end - c_start)
+                numbers.append(
+                    _Number(
+                        value=int(match[0]), row=r, col_start=c_start, col_end=c_end
+                    )
+                )
+            symbols.extend(
+                ((r, match.start()), match[0].decode())
+                for match in _SYMBOL_PATTERN.finditer(row)
+            )
+        object.__setattr__(self, "numbers", numbers)
+        object.__setattr__(self, "number_ids", number_ids)
+        object.__setattr__(self, "symbols", symbols)
+
+    def get_number_id(self, coord: _Coord) -> None | int:
+        """
+        Get the index in `numbers` of the number covering a cell, if any.
+        """
+        if coord not in self.grid:
+            raise IndexError(f"{coord} is outside of the schematic")
         row, col = coord
-        for r in range(max(0, row - 1), min(self.row_count, row + 2)):
-            for c in range(max(0, col - 1), min(self.col_count, col + 2)):
-                if r != row or c != col:
-                    yield r, c
+        number_id = self.number_ids[row * self.grid.col_count + col]
+        return None if number_id < 0 else number_id
 
-    def get_number(self, coord: _Coord) -> None | tuple[list[_Coord], int]:
-        row, col = coord
-        if not self[row, col].isdigit():
-            return None
-        c_start = col
-        while c_start > 0:
-            if not self[row, c_start - 1].isdigit():
-                break
-            c_start -= 1
-        c_end = col + 1
-        while c_end < self.col_count:
-            if not self[row, c_end].isdigit():
-                break
-            c_end += 1
-        num = int("".join(self.data[row][c_start:c_end]))
-        occupied_coords = [(row, c) for c in range(c_start, c_end)]
-        return occupied_coords, num
+    def get_adjacent_number_ids(self, coord: _Coord) -> set[int]:
+        """
+        Get the indices in `numbers` of the numbers next to a cell, diagonals included.
+        """
+        col_count = self.grid.col_count
+        number_ids = self.number_ids
+        adjacent_number_ids: set[int] = set()
+        for row, col in self.grid.iter_adjacent_coords(coord):
+            number_id = number_ids[row * col_count + col]
+            if number_id >= 0:
+                adjacent_number_ids.add(number_id)
+        return adjacent_number_ids
 
     def get_adjacent_numbers(self, coord: _Coord) -> list[int]:
         """
-        Note: the numbers are unordered
+        Get the values of the numbers next to a cell, in reading order.
         """
-        adjacent_numbers: list[int] = []
-        coords_to_check = set(self.iter_adjacent_coords(coord))
-        while coords_to_check:
-            check_coord, *_ = coords_to_check
-            num_result = self.get_number(check_coord)
-            if num_result is None:
-                coords_to_check.discard(check_coord)
-                continue
-            occupied_coords, num = num_result
-            coords_to_check.difference_update(occupied_coords)
-            adjacent_numbers.append(num)
-        return adjacent_numbers
+        return [
+            self.numbers[number_id].value
+            for number_id in sorted(self.get_adjacent_number_ids(coord))
+        ]
 
 
 class Solution(SolutionAbstract, day=3):
+    use_input_buffer = True
     schematic: _Schematic
 
-    def _process_data(self, raw_data: list[str]) -> None:
+    def _process_buffer(self, buffer: InputBuffer) -> None:
         """
         Process day 03 data.
         """
-        self.schematic = _Schematic(data=[list(row) for row in raw_data])
+        self.schematic = _Schematic(grid=Grid.from_rows(buffer.iter_lines()))
 
     def part_1(self, *, visualize: bool = False) -> int:
         """
         Day 03 part 1 solution.
         """
         sum_ = 0
-        for coord, cell in self.schematic.iter_cells():
-            if cell.isdigit() or cell == ".":
-                continue
+        for coord, _ in self.schematic.symbols:
             adjacent_numbers = self.schematic.get_adjacent_numbers(coord)
             sum_ += sum(adjacent_numbers)
         return sum_
@@ -101,8 +138,8 @@ class Solution(SolutionAbstract, day=3):
         Day 03 part 2 solution.
         """
         sum_ = 0
-        for coord, cell in self.schematic.iter_cells():
-            if cell != "*":
+        for coord, symbol in self.schematic.symbols:
+            if symbol != "*":
                 continue
             adjacent_numbers = self.schematic.get_adjacent_numbers(coord)
             if len(adjacent_numbers) != 2:
@@ -0,0 +1,37 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_WINNING_COUNT = 10
+_CONTAINING_COUNT = 25
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 04 input.
+    Args:
+        size (int): Number of cards
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    index_width = len(str(size))
+    rows: list[str] = []
+    for index in range(1, size + 1):
+        # Most cards win nothing, which keeps the card counts of part 2 from growing
+        #   exponentially. Cards never win copies of cards past the end of the table
+        won_count = rng.randint(1, _WINNING_COUNT) if rng.random() < 0.15 else 0
+        won_count = min(won_count, size - index)
+        nums = rng.sample(
+            range(1, 100), k=_WINNING_COUNT + _CONTAINING_COUNT - won_count
+        )
+        winning_nums = nums[:_WINNING_COUNT]
+        containing_nums = winning_nums[:won_count] + nums[_WINNING_COUNT:]
+        rng.shuffle(containing_nums)
+        winning_str = " ".join(f"{num:>2}" for num in winning_nums)
+        containing_str = " ".join(f"{num:>2}" for num in containing_nums)
+        rows.append(f"Card {index:>{index_width}}: {winning_str} | {containing_str}")
+    return "\n".join(rows) + "\n"
@@ -0,0 +1,64 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+_MAX_VALUE = 1 << 32
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 05 input.
+    Args:
+        size (int): Number of ranges in each map, and of seed ranges
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    seed_configs: list[int] = []
+    for _ in range(size):
+        seed_length = rng.randint(1, _MAX_VALUE // (size * 4))
+        seed_configs += [rng.randrange(_MAX_VALUE - seed_length), seed_length]
+    sections = [f"seeds: {' '.join(map(str, seed_configs))}"]
+    for src, dest in zip(_CATEGORIES, _CATEGORIES[1:]):
+        rows = [
+            f"{dest_start} {src_start} {length}"
+            for src_start, dest_start, length in _get_map_ranges(rng, size)
+        ]
+        sections.append("\n".join([f"{src}-to-{dest} map:", *rows]))
+    return "\n\n".join(sections) + "\n"
+
+
+def _get_map_ranges(rng: random.Random, size: int) -> list[tuple[int, int, int]]:
+    """
+    Split all values into ranges and map them to the same ranges in a shuffled order,
+      so that no source or destination values overlap
+    Returns:
+        (list[tuple[int, int, int]]): Source start, destination start and length of
+                                        each range, in a random order
+    """
+    cuts = sorted(rng.sample(range(1, _MAX_VALUE), k=size - 1))
+    src_starts = [0, *cuts]
+    lengths = [end - start for start, end in zip(src_starts, [*cuts, _MAX_VALUE])]
+    order = list(range(size))
+    rng.shuffle(order)
+    dest_starts = [0] * size
+    dest_start = 0
+    for i in order:
+        dest_starts[i] = dest_start
+        dest_start += lengths[i]
+    ranges = list(zip(src_starts, dest_starts, lengths))
+    rng.shuffle(ranges)
+    return ranges
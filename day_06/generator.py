@@ -0,0 +1,34 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 06 input. Part 2 joins all times and all distances into one race,
+      whose numbers grow with the number of races.
+    Args:
+        size (int): Number of races
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    times: list[int] = []
+    distances: list[int] = []
+    for _ in range(size):
+        time = rng.randint(7, 99)
+        times.append(time)
+        # The record can always be beaten by holding the button for half of the time
+        distances.append(rng.randint(time, time * time // 4 - 1))
+    widths = [
+        max(len(str(time)), len(str(distance)))
+        for time, distance in zip(times, distances)
+    ]
+    time_str = "  ".join(f"{time:>{width}}" for time, width in zip(times, widths))
+    distance_str = "  ".join(
+        f"{distance:>{width}}" for distance, width in zip(distances, widths)
+    )
+    return f"Time:      {time_str}\nDistance:  {distance_str}\n"
@@ -15,12 +15,20 @@ class _Race:
     distance: int
 
     def get_win_count(self) -> int:
-        discriminant = self.time * self.time - 4 * self.distance
-        if discriminant <= 0:
+        half_time = self.time // 2
+        # Holding the button for half of the time goes the farthest
+        if half_time * (self.time - half_time) <= self.distance:
             return 0
-        sd = math.sqrt(discriminant)
-        t_min = math.floor((self.time - sd) / 2) + 1
-        t_max = math.ceil((self.time + sd) / 2) - 1
+        discriminant = self.time * self.time - 4 * self.distance
+        # Integer square root, so that races of any length are exact
+        t_min = (self.time - math.isqrt(discriminant)) // 2
+        # The root is rounded down, so the shortest winning hold is at most 2 away
+        while t_min * (self.time - t_min) <= self.distance:
+            t_min += 1
+        while t_min > 0 and (t_min - 1) * (self.time - t_min + 1) > self.distance:
+            t_min -= 1
+        # Winning holds are symmetric around half of the time
+        t_max = self.time - t_min
         return t_max - t_min + 1
 
 
@@ -0,0 +1,24 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_CARDS = "AKQJT98765432"
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 07 input.
+    Args:
+        size (int): Number of hands
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows = [
+        f"{''.join(rng.choices(_CARDS, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+    return "\n".join(rows) + "\n"
@@ -0,0 +1,102 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+import string
+from math import isqrt
+
+_MAX_GHOST_COUNT = 6
+# Last letters of nodes that are neither starts nor ends
+_MIDDLE_LAST_LETTERS = string.ascii_uppercase[1:-1]
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 08 input.
+
+    As in the puzzle input, every start node `..A` reaches its end node `..Z` after a
+      multiple of the instruction count, and then loops back to the same end node in
+      as many steps. The path from `AAA` ends at `ZZZ`.
+    Args:
+        size (int): Approximate number of nodes
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    ghost_count = max(1, min(_MAX_GHOST_COUNT, size // 8))
+    loop_node_count = max(2, size // ghost_count)
+    instructions = "".join(rng.choices("LR", k=max(1, isqrt(loop_node_count))))
+    loop_sizes = [
+        prime * len(instructions)
+        for prime in _get_primes(
+            max(2, loop_node_count // len(instructions)), count=ghost_count
+        )
+    ]
+    start_end_prefixes = ["ZZ", *rng.sample(_get_names(2)[1:-1], k=ghost_count - 1)]
+    middle_names = _get_middle_names(rng, sum(loop_sizes) - ghost_count)
+    # Children of each node, as the child taken and any other child
+    children: dict[str, tuple[str, str]] = {}
+    loop_starts_index = 0
+    for prefix, loop_size in zip(start_end_prefixes, loop_sizes):
+        start_name = "AAA" if prefix == "ZZ" else f"{prefix}A"
+        loop_names = [
+            *middle_names[loop_starts_index : loop_starts_index + loop_size - 1],
+            f"{prefix}Z",
+        ]
+        loop_starts_index += loop_size - 1
+        # Walk from the start, then keep looping from the end
+        for step, (name, next_name) in enumerate(
+            zip([start_name, *loop_names], [*loop_names, loop_names[0]])
+        ):
+            children[name] = (instructions[step % len(instructions)], next_name)
+    all_names = list(children)
+    rows: list[str] = []
+    for name, (instruction, next_name) in children.items():
+        other_name = rng.choice(all_names)
+        left_name, right_name = (
+            (next_name, other_name) if instruction == "L" else (other_name, next_name)
+        )
+        rows.append(f"{name} = ({left_name}, {right_name})")
+    rng.shuffle(rows)
+    return f"{instructions}\n\n" + "\n".join(rows) + "\n"
+
+
+def _get_primes(start: int, *, count: int) -> list[int]:
+    primes: list[int] = []
+    candidate = start
+    while len(primes) < count:
+        if all(candidate % divisor for divisor in range(2, isqrt(candidate) + 1)):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _get_names(length: int) -> list[str]:
+    """
+    Get all names of uppercase letters of the given length, in order
+    """
+    names = [""]
+    for _ in range(length):
+        names = [name + letter for name in names for letter in string.ascii_uppercase]
+    return names
+
+
+def _get_middle_names(rng: random.Random, count: int) -> list[str]:
+    """
+    Get distinct random names that end with neither `A` nor `Z`
+    """
+    prefix_length = 2
+    while 26**prefix_length * len(_MIDDLE_LAST_LETTERS) < count:
+        prefix_length += 1
+    last_letter_count = len(_MIDDLE_LAST_LETTERS)
+    names: list[str] = []
+    for index in rng.sample(range(26**prefix_length * last_letter_count), k=count):
+        prefix_index, last_letter_index = divmod(index, last_letter_count)
+        prefix = ""
+        for _ in range(prefix_length):
+            prefix_index, letter_index = divmod(prefix_index, 26)
+            prefix += string.ascii_uppercase[letter_index]
+        names.append(prefix + _MIDDLE_LAST_LETTERS[last_letter_index])
+    return names
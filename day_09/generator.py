@@ -0,0 +1,32 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+_VALUE_COUNT = 21
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 09 input.
+    Args:
+        size (int): Number of histories
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows: list[str] = []
+    for _ in range(size):
+        # Polynomials of a degree lower than the number of values always reach all
+        #   zero differences
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 9))]
+        values = [
+            sum(
+                coefficient * x**power for power, coefficient in enumerate(coefficients)
+            )
+            for x in range(_VALUE_COUNT)
+        ]
+        rows.append(" ".join(map(str, values)))
+    return "\n".join(rows) + "\n"
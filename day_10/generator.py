@@ -0,0 +1,110 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    type _Coord = tuple[int, int]
+
+# Pipe connecting each pair of directions, as (row, col) offsets
+_PIPES = {
+    frozenset({(-1, 0), (1, 0)}): "|",
+    frozenset({(0, -1), (0, 1)}): "-",
+    frozenset({(-1, 0), (0, 1)}): "L",
+    frozenset({(-1, 0), (0, -1)}): "J",
+    frozenset({(1, 0), (0, -1)}): "7",
+    frozenset({(1, 0), (0, 1)}): "F",
+}
+# Pipes that would connect to a tile from each side of it
+_CONNECTING_PIPES = {
+    (-1, 0): "|7F",
+    (1, 0): "|LJ",
+    (0, -1): "-LF",
+    (0, 1): "-J7",
+}
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 10 input.
+
+    The loop is the outline of a random shape made of columns of tiles, so that it
+      encloses tiles for part 2. All other tiles are random pipes, except that none of
+      them connect to the animal.
+    Args:
+        size (int): Width and height of the field, at least 3
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    if size < 3:
+        raise ValueError(f"{size=} must be at least 3")
+    rng = random.Random(seed)
+    loop = _get_loop(rng, size)
+    field = [[rng.choice("|-LJ7F.") for _ in range(size)] for _ in range(size)]
+    for prev_coord, coord, next_coord in zip(
+        [loop[-1], *loop[:-1]], loop, [*loop[1:], loop[0]]
+    ):
+        directions = frozenset(
+            (other_row - coord[0], other_col - coord[1])
+            for other_row, other_col in (prev_coord, next_coord)
+        )
+        field[coord[0]][coord[1]] = _PIPES[directions]
+    animal_row, animal_col = rng.choice(loop)
+    field[animal_row][animal_col] = "S"
+    for (row_offset, col_offset), pipes in _CONNECTING_PIPES.items():
+        row = animal_row + row_offset
+        col = animal_col + col_offset
+        if (row, col) in loop:
+            continue
+        if 0 <= row < size and 0 <= col < size and field[row][col] in pipes:
+            field[row][col] = "."
+    return "\n".join("".join(row) for row in field) + "\n"
+
+
+def _get_loop(rng: random.Random, size: int) -> list[_Coord]:
+    """
+    Get the outline of a random shape of squares between the tiles, i.e. each square
+      has 4 tiles as its corners. Each column of squares overlaps the previous one, so
+      the outline never touches itself.
+    Returns:
+        (list[_Coord]): Tiles of the outline, in order
+    """
+    square_count = size - 1
+    max_step = max(1, square_count // 4)
+    squares: set[_Coord] = set()
+    top = rng.randrange(square_count)
+    bottom = rng.randint(top + 1, square_count)
+    margin = max(1, square_count // 4)
+    for col in range(rng.randrange(margin), square_count - rng.randrange(margin)):
+        squares.update((row, col) for row in range(top, bottom))
+        new_top = min(max(0, top + rng.randint(-max_step, max_step)), bottom - 1)
+        new_bottom = min(square_count, bottom + rng.randint(-max_step, max_step))
+        top, bottom = new_top, max(new_bottom, new_top + 1, top + 1)
+    # Edges between tiles with exactly one square on either side
+    edge_counts: dict[frozenset[_Coord], int] = {}
+    for row, col in squares:
+        corners = [(row, col), (row, col + 1), (row + 1, col + 1), (row + 1, col)]
+        for corner, next_corner in zip(corners, [*corners[1:], corners[0]]):
+            edge = frozenset({corner, next_corner})
+            edge_counts[edge] = edge_counts.get(edge, 0) + 1
+    neighbors: dict[_Coord, list[_Coord]] = {}
+    for edge, count in edge_counts.items():
+        if count != 1:
+            continue
+        coord_1, coord_2 = edge
+        neighbors.setdefault(coord_1, []).append(coord_2)
+        neighbors.setdefault(coord_2, []).append(coord_1)
+    start = min(neighbors)
+    loop = [start]
+    prev_coord, coord = start, neighbors[start][0]
+    while coord != start:
+        loop.append(coord)
+        next_coord_1, next_coord_2 = neighbors[coord]
+        prev_coord, coord = (
+            coord,
+            next_coord_2 if next_coord_1 == prev_coord else next_coord_1,
+        )
+    return loop
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 from PIL import Image
 
+from grid import Grid
 from utils import SolutionAbstract
 
 if TYPE_CHECKING:
@@ -114,39 +115,27 @@ class _Walk:
 
 @dataclass(frozen=True, kw_only=True)
 class _Field:
-    pipes: list[list[str]]
+    pipes: Grid
     animal_coord: _Coord = field(init=False)
     row_count: int = field(init=False)
     col_count: int = field(init=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "animal_coord", self._get_animal_coord())
-        object.__setattr__(self, "row_count", len(self.pipes))
-        object.__setattr__(self, "col_count", len(self.pipes[0]))
+        object.__setattr__(self, "row_count", self.pipes.row_count)
+        object.__setattr__(self, "col_count", self.pipes.col_count)
 
     def __getitem__(self, coord: _Coord) -> str:
-        row, col = coord
-        return self.pipes[row][col]
+        return self.pipes[coord]
 
     def _get_animal_coord(self) -> _Coord:
-        for r, row in enumerate(self.pipes):
-            for c, cell in enumerate(row):
-                if cell == "S":
-                    return (r, c)
-        raise ValueError("Animal not found")
+        animal_coord = self.pipes.find("S")
+        if animal_coord is None:
+            raise ValueError("Animal not found")
+        return animal_coord
 
     def get_neighbor_coords(self, coord: _Coord) -> list[_Coord]:
-        coords: list[_Coord] = []
-        row, col = coord
-        if row > 0:
-            coords.append((row - 1, col))
-        if row < self.row_count - 1:
-            coords.append((row + 1, col))
-        if col > 0:
-            coords.append((row, col - 1))
-        if col < self.col_count - 1:
-            coords.append((row, col + 1))
-        return coords
+        return list(self.pipes.iter_neighbor_coords(coord))
 
     def get_walk(self, *, coord: _Coord, direction: _D) -> _Walk:
         return _Walk(field=self, coord=coord, direction=direction)
@@ -324,7 +313,7 @@ class Solution(SolutionAbstract, day=10):
         """
         Process day 10 data.
         """
-        self.field = _Field(pipes=[list(row) for row in raw_data])
+        self.field = _Field(pipes=Grid.from_rows(raw_data))
 
     def part_1(self, *, visualize: bool = False) -> int:
         """
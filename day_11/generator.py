@@ -0,0 +1,29 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 11 input.
+    Args:
+        size (int): Width and height of the image
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(size), k=size // 15))
+    empty_cols = set(rng.sample(range(size), k=size // 15))
+    rows = [
+        "".join(
+            "#"
+            if r not in empty_rows and c not in empty_cols and rng.random() < 1 / 40
+            else "."
+            for c in range(size)
+        )
+        for r in range(size)
+    ]
+    return "\n".join(rows) + "\n"
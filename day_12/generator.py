@@ -0,0 +1,28 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 12 input.
+    Args:
+        size (int): Number of records
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows: list[str] = []
+    for _ in range(size):
+        springs = [rng.choice("#.") for _ in range(rng.randint(1, 20))]
+        # Every record has at least one damaged spring group
+        springs[rng.randrange(len(springs))] = "#"
+        group_sizes = [len(group) for group in "".join(springs).split(".") if group]
+        springs_str = "".join(
+            "?" if rng.random() < 0.4 else spring for spring in springs
+        )
+        rows.append(f"{springs_str} {','.join(map(str, group_sizes))}")
+    return "\n".join(rows) + "\n"
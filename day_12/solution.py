@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from functools import cache
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, memoize
 
 if TYPE_CHECKING:
     from typing import Self
@@ -36,7 +35,7 @@ class _Record:
         )
 
     @classmethod
-    @cache
+    @memoize(maxsize=1 << 16)
     def _get_possibilities_count(
         cls, *, springs_str: str, damaged_spring_group_sizes: tuple[int, ...]
     ) -> int:
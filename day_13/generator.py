@@ -0,0 +1,118 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    type _Coord = tuple[int, int]
+    type _Line = tuple[bool, int]
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 13 input.
+
+    Each pattern has exactly one line of reflection, and exactly one other line that
+      becomes a line of reflection once its smudge is fixed.
+    Args:
+        size (int): Number of patterns
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    patterns: list[str] = []
+    while len(patterns) < size:
+        pattern = _get_pattern(
+            rng, row_count=rng.randint(5, 17), col_count=rng.randint(5, 17)
+        )
+        if pattern is not None:
+            patterns.append("\n".join("".join(row) for row in pattern))
+    return "\n\n".join(patterns) + "\n"
+
+
+def _get_pattern(
+    rng: random.Random, *, row_count: int, col_count: int
+) -> None | list[list[str]]:
+    """
+    Try to get a pattern with a random line of reflection and a random line of
+      reflection after fixing a random smudge
+    Returns:
+        (None | list[list[str]]): Pattern, if the lines can be made to work
+    """
+    lines: list[_Line] = [(True, i) for i in range(1, row_count)] + [
+        (False, i) for i in range(1, col_count)
+    ]
+    line, smudge_line = rng.sample(lines, k=2)
+    mirrored_pairs = _get_mirrored_pairs(line, row_count=row_count, col_count=col_count)
+    smudge_pairs = _get_mirrored_pairs(
+        smudge_line, row_count=row_count, col_count=col_count
+    )
+    smudge_pair = rng.choice(smudge_pairs)
+    # Cells that must be equal form groups that share one value
+    parents: dict[_Coord, _Coord] = {}
+
+    def find(coord: _Coord) -> _Coord:
+        while (parent := parents.get(coord, coord)) != coord:
+            coord = parent
+        return coord
+
+    for coord_1, coord_2 in mirrored_pairs + smudge_pairs:
+        if (coord_1, coord_2) == smudge_pair:
+            continue
+        root_1 = find(coord_1)
+        root_2 = find(coord_2)
+        if root_1 != root_2:
+            parents[root_1] = root_2
+    smudge_root_1 = find(smudge_pair[0])
+    smudge_root_2 = find(smudge_pair[1])
+    if smudge_root_1 == smudge_root_2:
+        return None
+    root_values = {smudge_root_1: "#", smudge_root_2: "."}
+    pattern = [
+        [
+            root_values.setdefault(find((r, c)), rng.choice("#."))
+            for c in range(col_count)
+        ]
+        for r in range(row_count)
+    ]
+    mismatch_counts = [
+        sum(
+            pattern[r_1][c_1] != pattern[r_2][c_2]
+            for (r_1, c_1), (r_2, c_2) in _get_mirrored_pairs(
+                other_line, row_count=row_count, col_count=col_count
+            )
+        )
+        for other_line in lines
+    ]
+    # Other lines may be reflections, or be one smudge away from one, by chance
+    if mismatch_counts.count(0) != 1 or mismatch_counts.count(1) != 1:
+        return None
+    return pattern
+
+
+def _get_mirrored_pairs(
+    line: _Line, *, row_count: int, col_count: int
+) -> list[tuple[_Coord, _Coord]]:
+    """
+    Get all pairs of cells that mirror each other over a line
+    Args:
+        line (_Line): Whether the line is between rows, and the number of rows or
+                        columns before it
+    Returns:
+        (list[tuple[_Coord, _Coord]]): Pairs of mirrored cells
+    """
+    is_row_line, index = line
+    length = row_count if is_row_line else col_count
+    other_length = col_count if is_row_line else row_count
+    pairs: list[tuple[_Coord, _Coord]] = []
+    for offset in range(min(index, length - index)):
+        for other in range(other_length):
+            before, after = index - 1 - offset, index + offset
+            if is_row_line:
+                pairs.append(((before, other), (after, other)))
+            else:
+                pairs.append(((other, before), (other, after)))
+    return pairs
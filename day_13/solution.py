@@ -3,25 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import cache
 from itertools import product
 
-from utils import SolutionAbstract
+from grid import Grid
+from utils import SolutionAbstract, memoize
 
 
 @dataclass(frozen=True, kw_only=True)
 class _Pattern:
-    data: tuple[tuple[str, ...], ...]
-    transposed_data: tuple[tuple[str, ...], ...] = field(init=False)
+    grid: Grid
     row_count: int = field(init=False)
     col_count: int = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(
-            self, "transposed_data", tuple(map(tuple, zip(*self.data, strict=True)))
-        )
-        object.__setattr__(self, "row_count", len(self.data))
-        object.__setattr__(self, "col_count", len(self.data[0]))
+        object.__setattr__(self, "row_count", self.grid.row_count)
+        object.__setattr__(self, "col_count", self.grid.col_count)
 
     def get_reflection_score(self, *, exclude: None | int = None) -> None | int:
         row_exclude = col_exclude = None
@@ -38,15 +34,17 @@ class _Pattern:
             return col
 
     def _get_reflection_row(self, *, exclude: None | int = None) -> None | int:
-        return self._get_hori_reflection_index(self.data, exclude=exclude)
+        return self._get_hori_reflection_index(self.grid.get_rows(), exclude=exclude)
 
     def _get_reflection_col(self, *, exclude: None | int = None) -> None | int:
-        return self._get_hori_reflection_index(self.transposed_data, exclude=exclude)
+        return self._get_hori_reflection_index(
+            self.grid.transpose().get_rows(), exclude=exclude
+        )
 
     @staticmethod
-    @cache
+    @memoize(maxsize=1024)
     def _get_hori_reflection_index(
-        pattern_data: tuple[tuple[str, ...], ...], *, exclude: None | int = None
+        pattern_data: tuple[bytes, ...], *, exclude: None | int = None
     ) -> None | int:
         for i in range(1, len(pattern_data)):
             if i == exclude:
@@ -68,14 +66,14 @@ class Solution(SolutionAbstract, day=13):
         Process day 13 data.
         """
         patterns: list[_Pattern] = []
-        pattern_data: list[tuple[str, ...]] = []
+        pattern_rows: list[str] = []
         for row in raw_data + [""]:
             if not row:
-                patterns.append(_Pattern(data=tuple(pattern_data)))
-                pattern_data = []
+                patterns.append(_Pattern(grid=Grid.from_rows(pattern_rows)))
+                pattern_rows = []
             else:
-                pattern_data.append(tuple(row))
-        assert not pattern_data
+                pattern_rows.append(row)
+        assert not pattern_rows
         self.patterns = patterns
 
     def part_1(self, *, visualize: bool = False) -> int:
@@ -102,16 +100,11 @@ class Solution(SolutionAbstract, day=13):
             for change_row_index, change_col_index in product(
                 range(pattern.row_count), range(pattern.col_count)
             ):
-                new_pattern_data = tuple(
-                    tuple(
-                        ("#" if cell == "." else ".") if c == change_col_index else cell
-                        for c, cell in enumerate(row)
-                    )
-                    if r == change_row_index
-                    else row
-                    for r, row in enumerate(pattern.data)
+                change_coord = (change_row_index, change_col_index)
+                new_cell = "#" if pattern.grid[change_coord] == "." else "."
+                new_pattern = _Pattern(
+                    grid=pattern.grid.replace(change_coord, new_cell)
                 )
-                new_pattern = _Pattern(data=new_pattern_data)
                 new_score = new_pattern.get_reflection_score(exclude=score)
                 if new_score is None:
                     continue
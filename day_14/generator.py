@@ -0,0 +1,48 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 14 input. Platforms that a spin cycle leaves unchanged are generated
+      again, as the puzzle input never is one.
+    Args:
+        size (int): Width and height of the platform, at least 2, as every 1x1
+                      platform is left unchanged
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    if size < 2:
+        raise ValueError(f"{size=} must be at least 2")
+    rng = random.Random(seed)
+    while True:
+        rows = [
+            "".join(rng.choices("O#.", weights=(1, 1, 4), k=size)) for _ in range(size)
+        ]
+        if _spin_cycle(rows) != rows:
+            return "\n".join(rows) + "\n"
+
+
+def _spin_cycle(rows: list[str]) -> list[str]:
+    """
+    Roll the rocks north, west, south and east, by rolling north and turning the
+      platform clockwise 4 times.
+    """
+    for _ in range(4):
+        rows = ["".join(col) for col in zip(*reversed(_roll_north(rows)), strict=True)]
+    return rows
+
+
+def _roll_north(rows: list[str]) -> list[str]:
+    # Round rocks sort before empty spaces between cube rocks
+    rolled_cols = [
+        "#".join(
+            "".join(sorted(part, reverse=True)) for part in "".join(col).split("#")
+        )
+        for col in zip(*rows, strict=True)
+    ]
+    return ["".join(row) for row in zip(*rolled_cols, strict=True)]
@@ -3,84 +3,70 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import cache
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from grid import Grid
+from utils import SolutionAbstract, memoize
 
 if TYPE_CHECKING:
     from typing import Self
 
-    type _Tuple[T] = tuple[T, ...]
-    type _2DTuple[T] = tuple[_Tuple[T], ...]
-
 
 @dataclass(frozen=True, kw_only=True)
 class _Platform:
-    data: _2DTuple[str]
-
-    @staticmethod
-    @cache
-    def _transpose(data: _2DTuple[str]) -> _2DTuple[str]:
-        return tuple(map(tuple, zip(*data, strict=True)))
-
-    @staticmethod
-    @cache
-    def _reverse(data: _2DTuple[str]) -> _2DTuple[str]:
-        return tuple(row[::-1] for row in data)
+    grid: Grid
 
     @staticmethod
-    @cache
-    def _roll_row(row: _Tuple[str]) -> _Tuple[str]:
-        row_str = "".join(row)
-        segments = row_str.split("#")
+    @memoize(maxsize=1 << 14)
+    def _roll_row(row: bytes) -> bytes:
+        segments = row.split(b"#")
         rolled_segment_gen = (
-            "O" * (c := segment.count("O")) + "." * (len(segment) - c)
+            b"O" * (c := segment.count(b"O")) + b"." * (len(segment) - c)
             for segment in segments
         )
-        return tuple("#".join(rolled_segment_gen))
+        return b"#".join(rolled_segment_gen)
 
     @classmethod
-    @cache
-    def _roll_rows(cls, data: _2DTuple[str]) -> _2DTuple[str]:
-        return tuple(cls._roll_row(row) for row in data)
+    @memoize(maxsize=1024)
+    def _roll_rows(cls, grid: Grid) -> Grid:
+        return Grid.from_rows(cls._roll_row(row) for row in grid.get_rows())
 
-    @cache
+    @memoize(maxsize=1024)
     def roll_north(self) -> Self:
-        converted_data = self._transpose(self.data)
-        rolled_converted_data = self._roll_rows(converted_data)
-        rolled_data = self._transpose(rolled_converted_data)
-        return type(self)(data=rolled_data)
+        converted_grid = self.grid.transpose()
+        rolled_converted_grid = self._roll_rows(converted_grid)
+        rolled_grid = rolled_converted_grid.transpose()
+        return type(self)(grid=rolled_grid.copy())
 
-    @cache
+    @memoize(maxsize=1024)
     def roll_south(self) -> Self:
-        converted_data = self._reverse(self._transpose(self.data))
-        rolled_converted_data = self._roll_rows(converted_data)
-        rolled_data = self._transpose(self._reverse(rolled_converted_data))
-        return type(self)(data=rolled_data)
+        converted_grid = self.grid.transpose().reverse_cols()
+        rolled_converted_grid = self._roll_rows(converted_grid)
+        rolled_grid = rolled_converted_grid.reverse_cols().transpose()
+        return type(self)(grid=rolled_grid.copy())
 
-    @cache
+    @memoize(maxsize=1024)
     def roll_west(self) -> Self:
-        converted_data = self.data
-        rolled_converted_data = self._roll_rows(converted_data)
-        rolled_data = rolled_converted_data
-        return type(self)(data=rolled_data)
+        converted_grid = self.grid
+        rolled_converted_grid = self._roll_rows(converted_grid)
+        rolled_grid = rolled_converted_grid
+        return type(self)(grid=rolled_grid)
 
-    @cache
+    @memoize(maxsize=1024)
     def roll_east(self) -> Self:
-        converted_data = self._reverse(self.data)
-        rolled_converted_data = self._roll_rows(converted_data)
-        rolled_data = self._reverse(rolled_converted_data)
-        return type(self)(data=rolled_data)
+        converted_grid = self.grid.reverse_cols()
+        rolled_converted_grid = self._roll_rows(converted_grid)
+        rolled_grid = rolled_converted_grid.reverse_cols()
+        return type(self)(grid=rolled_grid.copy())
 
-    @cache
+    @memoize(maxsize=1024)
     def spin_cycle(self) -> Self:
         return self.roll_north().roll_west().roll_south().roll_east()
 
     def get_north_load(self) -> int:
         return sum(
-            i * sum(1 for cell in row if cell == "O")
-            for i, row in enumerate(reversed(self.data), start=1)
+            i * row.count(b"O")
+            for i, row in enumerate(reversed(self.grid.get_rows()), start=1)
         )
 
 
@@ -91,7 +77,7 @@ class Solution(SolutionAbstract, day=14):
         """
         Process day 14 data.
         """
-        self.platform = _Platform(data=tuple(tuple(row) for row in raw_data))
+        self.platform = _Platform(grid=Grid.from_rows(raw_data))
 
     def part_1(self, *, visualize: bool = False) -> int:
         """
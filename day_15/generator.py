@@ -0,0 +1,28 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+import string
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 15 input.
+    Args:
+        size (int): Number of steps
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    # Labels are reused so that lenses get replaced and removed
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 4))
+    ]
+    steps = [
+        f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        for label in rng.choices(labels, k=size)
+    ]
+    return ",".join(steps) + "\n"
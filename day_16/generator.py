@@ -0,0 +1,22 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+import random
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 16 input.
+    Args:
+        size (int): Width and height of the contraption
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    rng = random.Random(seed)
+    rows = [
+        "".join(rng.choices("./\\-|", weights=(36, 1, 1, 1, 1), k=size))
+        for _ in range(size)
+    ]
+    return "\n".join(rows) + "\n"
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from itertools import chain
 from typing import TYPE_CHECKING
 
+from grid import Grid
 from utils import SolutionAbstract
 
 if TYPE_CHECKING:
@@ -14,20 +15,13 @@ if TYPE_CHECKING:
     type _Direction = complex
     type _LightState = tuple[_Coord, _Direction]
 
-    type _ImmutableList[T] = tuple[T, ...]
-    type _Immutable2DArray[T] = tuple[_ImmutableList[T], ...]
-
 
 @dataclass(frozen=True, kw_only=True)
 class _Contraption:
-    data: _Immutable2DArray[str]
-    row_count: int = field(init=False)
-    col_count: int = field(init=False)
+    grid: Grid
     next_state_cache: dict[_LightState, list[_LightState]] = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "row_count", len(self.data))
-        object.__setattr__(self, "col_count", len(self.data[0]))
         object.__setattr__(self, "next_state_cache", {})
 
     def __getitem__(self, coord: _Coord) -> str:
@@ -35,9 +29,7 @@ class _Contraption:
         col = coord.real
         if not row.is_integer() or not col.is_integer():
             raise ValueError("Non-integer rows and columns are not allowed")
-        if row < 0 or col < 0:
-            raise IndexError("Negative rows and columns are not allowed")
-        return self.data[int(row)][int(col)]
+        return self.grid[int(row), int(col)]
 
     def get_next_states(self, curr_state: _LightState) -> list[_LightState]:
         with suppress(KeyError):
@@ -88,7 +80,7 @@ class Solution(SolutionAbstract, day=16):
         """
         Process day 16 data.
         """
-        self.contraption = _Contraption(data=tuple(map(tuple, raw_data)))
+        self.contraption = _Contraption(grid=Grid.from_rows(raw_data))
 
     def part_1(self, *, visualize: bool = False) -> int:
         """
@@ -100,8 +92,8 @@ class Solution(SolutionAbstract, day=16):
         """
         Day 16 part 2 solution.
         """
-        row_count = self.contraption.row_count
-        col_count = self.contraption.col_count
+        row_count = self.contraption.grid.row_count
+        col_count = self.contraption.grid.col_count
         starting_state_iter: chain[_LightState] = chain(
             ((-1 + r * 1j, 1) for r in range(row_count)),
             ((col_count + r * 1j, -1) for r in range(row_count)),
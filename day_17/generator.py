@@ -0,0 +1,15 @@
+# pyright: reportMissingTypeStubs=false
+
+from __future__ import annotations
+
+
+def generate(size: int, *, seed: int = 0) -> str:
+    """
+    Generate a day 17 input.
+    Args:
+        size (int): Size of the input
+        seed (int): Seed of the random number generator
+    Returns:
+        (str): Input text, in the same format as the puzzle input
+    """
+    raise NotImplementedError(f"No day 17 input generator ({size=}, {seed=})")
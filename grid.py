@@ -0,0 +1,282 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Compact grid of single-character cells shared by the grid-based days
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Self
+
+    type _Coord = tuple[int, int]
+
+# Cell strings by byte value, so that reading a cell does not create a string
+_CHARS = [chr(i) for i in range(256)]
+_NEIGHBOR_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+_ADJACENT_OFFSETS = [
+    (row_offset, col_offset)
+    for row_offset in (-1, 0, 1)
+    for col_offset in (-1, 0, 1)
+    if row_offset or col_offset
+]
+
+
+class Grid:
+    """
+    Immutable grid of ASCII cells, stored as one flat `bytes` buffer.
+
+    Cell `(row, col)` is the byte at `offset + row * row_stride + col * col_stride`.
+      Transposed and reversed grids are views that share the buffer and only change
+      the offset and strides, and rows and columns are `memoryview`s of the buffer, so
+      none of them copy cells. Views are compared and hashed by their cells.
+
+    Attributes:
+        data       (bytes): Buffer of the cells, possibly shared with other grids
+        row_count  (int)  : Number of rows
+        col_count  (int)  : Number of columns
+        offset     (int)  : Index of cell `(0, 0)` in `data`
+        row_stride (int)  : Distance in `data` between vertically adjacent cells
+        col_stride (int)  : Distance in `data` between horizontally adjacent cells
+    """
+
+    __slots__ = ("data", "row_count", "col_count", "offset", "row_stride", "col_stride")
+
+    data: bytes
+    row_count: int
+    col_count: int
+    offset: int
+    row_stride: int
+    col_stride: int
+
+    def __init__(
+        self,
+        data: bytes,
+        *,
+        row_count: int,
+        col_count: int,
+        offset: int = 0,
+        row_stride: None | int = None,
+        col_stride: int = 1,
+    ) -> None:
+        self.data = data
+        self.row_count = row_count
+        self.col_count = col_count
+        self.offset = offset
+        self.row_stride = col_count if row_stride is None else row_stride
+        self.col_stride = col_stride
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[str | bytes | memoryview]) -> Self:
+        """
+        Construct a grid from rows of equal length. Rows are copied, so views of other
+          buffers can be released afterwards.
+        """
+        encoded_rows = [
+            row.encode("ascii") if isinstance(row, str) else row for row in rows
+        ]
+        if not encoded_rows:
+            raise ValueError("Grid must have at least one row")
+        col_count = len(encoded_rows[0])
+        if any(len(row) != col_count for row in encoded_rows):
+            raise ValueError("Grid rows must have the same length")
+        return cls(
+            b"".join(encoded_rows), row_count=len(encoded_rows), col_count=col_count
+        )
+
+    def __getitem__(self, coord: _Coord) -> str:
+        row, col = coord
+        if not (0 <= row < self.row_count and 0 <= col < self.col_count):
+            raise IndexError(f"{coord} is outside of the grid")
+        return _CHARS[
+            self.data[self.offset + row * self.row_stride + col * self.col_stride]
+        ]
+
+    def __contains__(self, coord: _Coord) -> bool:
+        row, col = coord
+        return 0 <= row < self.row_count and 0 <= col < self.col_count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (
+            self.row_count == other.row_count
+            and self.col_count == other.col_count
+            and self.to_bytes() == other.to_bytes()
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.row_count, self.col_count, self.to_bytes()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_rows({self.get_rows()!r})"
+
+    @property
+    def is_contiguous(self) -> bool:
+        """
+        Whether the cells are stored row by row with nothing in between
+        """
+        return self.col_stride == 1 and self.row_stride == self.col_count
+
+    def to_bytes(self) -> bytes:
+        """
+        Get all cells row by row. Only views are copied.
+        """
+        size = self.row_count * self.col_count
+        if self.is_contiguous:
+            if self.offset == 0 and len(self.data) == size:
+                return self.data
+            return self.data[self.offset : self.offset + size]
+        return b"".join(self.get_rows())
+
+    def copy(self) -> Self:
+        """
+        Copy the cells of a view into a buffer of their own, which makes reads of
+          whole rows and hashing cheaper.
+        """
+        return type(self)(
+            self.to_bytes(), row_count=self.row_count, col_count=self.col_count
+        )
+
+    def replace(self, coord: _Coord, char: str) -> Self:
+        """
+        Copy the grid with one cell changed.
+        """
+        row, col = coord
+        if coord not in self:
+            raise IndexError(f"{coord} is outside of the grid")
+        data = bytearray(self.to_bytes())
+        data[row * self.col_count + col] = ord(char)
+        return type(self)(
+            bytes(data), row_count=self.row_count, col_count=self.col_count
+        )
+
+    def get_row(self, row: int) -> memoryview:
+        if not 0 <= row < self.row_count:
+            raise IndexError(f"Row {row} is outside of the grid")
+        return self._get_line(
+            self.offset + row * self.row_stride, self.col_stride, self.col_count
+        )
+
+    def get_col(self, col: int) -> memoryview:
+        if not 0 <= col < self.col_count:
+            raise IndexError(f"Column {col} is outside of the grid")
+        return self._get_line(
+            self.offset + col * self.col_stride, self.row_stride, self.row_count
+        )
+
+    def _get_line(self, start: int, step: int, length: int) -> memoryview:
+        """
+        Get a view of `length` cells of the buffer, `step` apart
+        """
+        return memoryview(self.data)[self._get_line_slice(start, step, length)]
+
+    @staticmethod
+    def _get_line_slice(start: int, step: int, length: int) -> slice:
+        stop = start + step * length
+        # A negative stop would count from the end of the buffer
+        return slice(start, stop if stop >= 0 else None, step)
+
+    def iter_rows(self) -> Iterator[memoryview]:
+        for row in range(self.row_count):
+            yield self.get_row(row)
+
+    def get_rows(self) -> tuple[bytes, ...]:
+        """
+        Get copies of all rows, e.g. to use as hashable keys
+        """
+        if self.is_contiguous:
+            data = self.to_bytes()
+            return tuple(
+                data[start : start + self.col_count]
+                for start in range(0, len(data), self.col_count)
+            )
+        # Slicing the buffer copies strided rows in one go
+        return tuple(
+            self.data[
+                self._get_line_slice(
+                    self.offset + row * self.row_stride,
+                    self.col_stride,
+                    self.col_count,
+                )
+            ]
+            for row in range(self.row_count)
+        )
+
+    def transpose(self) -> Self:
+        """
+        Get a view with rows and columns swapped.
+        """
+        return type(self)(
+            self.data,
+            row_count=self.col_count,
+            col_count=self.row_count,
+            offset=self.offset,
+            row_stride=self.col_stride,
+            col_stride=self.row_stride,
+        )
+
+    def reverse_rows(self) -> Self:
+        """
+        Get a view with the order of the rows reversed, i.e. flipped upside down.
+        """
+        return type(self)(
+            self.data,
+            row_count=self.row_count,
+            col_count=self.col_count,
+            offset=self.offset + (self.row_count - 1) * self.row_stride,
+            row_stride=-self.row_stride,
+            col_stride=self.col_stride,
+        )
+
+    def reverse_cols(self) -> Self:
+        """
+        Get a view with the order of the columns reversed, i.e. each row reversed.
+        """
+        return type(self)(
+            self.data,
+            row_count=self.row_count,
+            col_count=self.col_count,
+            offset=self.offset + (self.col_count - 1) * self.col_stride,
+            row_stride=self.row_stride,
+            col_stride=-self.col_stride,
+        )
+
+    def iter_cells(self) -> Iterator[tuple[_Coord, str]]:
+        for r, row in enumerate(self.iter_rows()):
+            for c, byte in enumerate(row):
+                yield (r, c), _CHARS[byte]
+
+    def find(self, char: str) -> None | _Coord:
+        """
+        Get the first coordinate of a cell, row by row, if any.
+        """
+        index = self.to_bytes().find(ord(char))
+        if index < 0:
+            return None
+        return divmod(index, self.col_count)
+
+    def iter_neighbor_coords(self, coord: _Coord) -> Iterator[_Coord]:
+        """
+        Iterate through the orthogonally adjacent coordinates inside the grid.
+        """
+        return self._iter_offset_coords(coord, _NEIGHBOR_OFFSETS)
+
+    def iter_adjacent_coords(self, coord: _Coord) -> Iterator[_Coord]:
+        """
+        Iterate through the orthogonally and diagonally adjacent coordinates inside the
+          grid.
+        """
+        return self._iter_offset_coords(coord, _ADJACENT_OFFSETS)
+
+    def _iter_offset_coords(
+        self, coord: _Coord, offsets: list[_Coord]
+    ) -> Iterator[_Coord]:
+        row, col = coord
+        for row_offset, col_offset in offsets:
+            r = row + row_offset
+            c = col + col_offset
+            if 0 <= r < self.row_count and 0 <= c < self.col_count:
+                yield r, c
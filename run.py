@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
+import json
 import shutil
+import sys
 from argparse import ArgumentParser
-from importlib import import_module
+from contextlib import nullcontext
+from glob import glob
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from colorama import Fore, init
 
-from aoc_io import download_input, submit_output
+# Only solving utilities are imported eagerly. Network, benchmarking and process pool
+#   modules are imported by the commands that need them to keep start-up fast
+from aoc_answers import AnswerStore
+from utils import (
+    CACHE_DIR,
+    STDIN_PATH,
+    get_generator,
+    get_solution,
+    get_solution_class,
+    get_solution_obj,
+)
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from typing import Any
 
-    from .utils import SolutionAbstract
+    from aoc_bench import PartBenchResult, PhaseStats
+    from aoc_profile import MemoryUsage
+    from utils import SolutionAbstract
 
 init(autoreset=True)
 
@@ -24,6 +41,15 @@ _DOWNLOAD_CMDS = ["d", "dl", "download"]
 _PRINT_CMDS = ["p", "pr", "print"]
 _SUBMIT_CMDS = ["s", "sub", "submit"]
 _METHOD_CMDS = ["m", "me", "method"]
+_BENCH_CMDS = ["b", "be", "bench"]
+_ALL_CMDS = ["a", "all"]
+_CACHE_CMDS = ["c", "cache"]
+_BATCH_CMDS = ["ba", "batch"]
+_GENERATE_CMDS = ["g", "gen", "generate"]
+_SERVE_CMDS = ["sv", "serve"]
+_CLIENT_CMDS = ["cl", "client"]
+_STATS_CMDS = ["st", "stats"]
+_BOTH_PARTS = ["both", "all"]
 
 
 def _main() -> None:
@@ -36,25 +62,179 @@ def _main() -> None:
 
     # Download input
     if args.command in _DOWNLOAD_CMDS:
-        download_input(day=args.day)
+        if args.day == "all":
+            from aoc_io import download_all
+
+            download_all(jobs=args.jobs, force=args.force)
+        else:
+            from aoc_io import download_input
+
+            download_input(day=int(args.day), force=args.force)
+        return
+
+    # Benchmark
+    if args.command in _BENCH_CMDS:
+        from aoc_bench import get_benchable_days
+
+        days = get_benchable_days() if args.day == "all" else [int(args.day)]
+        parts = [1, 2] if args.part is None else [args.part]
+        _bench(
+            days=days,
+            parts=parts,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            output=args.output,
+            use_parse_cache=args.parse_cache,
+            profile=args.profile,
+            track_memory=args.mem,
+            compare_ref=args.compare,
+            threshold=args.threshold,
+        )
+        return
+
+    # Update performance stats
+    if args.command in _STATS_CMDS:
+        _update_stats(warmup=args.warmup, repeat=args.repeat, output=args.output)
+        return
+
+    # Run all days in parallel
+    if args.command in _ALL_CMDS:
+        _run_all(
+            jobs=args.jobs,
+            estimates_path=args.estimates,
+            use_parse_cache=args.parse_cache,
+        )
+        return
+
+    # Solve many inputs
+    if args.command in _BATCH_CMDS:
+        parts = [1, 2] if args.part is None else [args.part]
+        _run_batch(
+            day=args.day,
+            inputs=args.inputs,
+            parts=parts,
+            jobs=args.jobs,
+            output=args.output,
+        )
+        return
+
+    # Generate input
+    if args.command in _GENERATE_CMDS:
+        _generate(day=args.day, size=args.size, seed=args.seed, output=args.output)
+        return
+
+    # Manage caches
+    if args.command in _CACHE_CMDS:
+        _manage_cache(args.action)
         return
 
-    # Get solution object
-    solution_obj = _get_solution_obj(args.day)
+    # Serve warm solutions
+    if args.command in _SERVE_CMDS:
+        _serve(stop=args.stop)
+        return
+
+    # Get solution from the server
+    if args.command in _CLIENT_CMDS:
+        _request_solution(
+            day=args.day, part=args.part, input_path=args.input, timings=args.timings
+        )
+        return
+
+    # Run method
     if args.command in _METHOD_CMDS:
+        solution_obj = get_solution_obj(
+            args.day, input_path=args.input, use_parse_cache=args.parse_cache
+        )
         _run_method(solution_obj=solution_obj, day=args.day, method_name=args.method)
         return
 
     # Run and get solution
     if args.part is None:
         raise ValueError("No part number provided.")
-    solution = _get_solution(solution_obj, args.part, visualize=args.visualize)
-    if solution is None:
-        print(f"{Fore.RED}No response got. This part may need manual processing.")
-        return
-    print(f"{Fore.GREEN}Got solution {solution!r}")
-    if args.command in _SUBMIT_CMDS:
-        submit_output(day=args.day, part=args.part, answer=solution)
+    # `both` and `all` solve the parts from a single parse
+    parts = [1, 2] if args.part in _BOTH_PARTS else [int(args.part)]
+    # Stored answers are only for the day's `input.txt`
+    input_path: None | Path = getattr(args, "input", None)
+    store = None if input_path is not None else AnswerStore()
+    profile: bool = getattr(args, "profile", False)
+    track_memory: bool = getattr(args, "mem", False)
+    timeout: None | float = args.timeout
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"{timeout=} must be positive")
+    solutions: dict[int, None | str | int] = {}
+    if (
+        store is not None
+        and not args.no_cache
+        and not args.visualize
+        and not profile
+        and not track_memory
+    ):
+        for part in parts:
+            stored_answer = store.get(day=args.day, part=part)
+            if stored_answer is None:
+                continue
+            solutions[part] = stored_answer.answer
+            print(
+                f"{Fore.CYAN}Using {_get_part_label(part, parts)}answer stored at"
+                f" {stored_answer.created}"
+            )
+    unsolved_parts = [part for part in parts if part not in solutions]
+    timings = None
+    if unsolved_parts:
+        memory_tracker = None
+        if track_memory:
+            from aoc_profile import MemoryTracker
+
+            # Imported beforehand so that the module is not counted as parsed data
+            get_solution_class(args.day, streaming=args.stream)
+            memory_tracker = MemoryTracker()
+        with (
+            nullcontext() if memory_tracker is None else memory_tracker.measure("parse")
+        ):
+            solution_obj = get_solution_obj(
+                args.day,
+                input_path=input_path,
+                use_parse_cache=args.parse_cache,
+                streaming=args.stream,
+            )
+        for part in unsolved_parts:
+            with (
+                nullcontext()
+                if memory_tracker is None
+                else memory_tracker.measure(f"part_{part}")
+            ):
+                solutions[part] = _get_watched_solution(
+                    solution_obj,
+                    part,
+                    timeout=timeout,
+                    profile=profile,
+                    visualize=args.visualize,
+                )
+        timings = solution_obj.timings
+        if memory_tracker is not None:
+            _print_memory(memory_tracker.usages)
+    for part in parts:
+        solution = solutions[part]
+        part_label = _get_part_label(part, parts)
+        if solution is None:
+            print(
+                f"{Fore.RED}No {part_label}response got."
+                " This part may need manual processing."
+            )
+            continue
+        print(f"{Fore.GREEN}Got {part_label}solution {solution!r}")
+        if timings is not None and store is not None and part in unsolved_parts:
+            part_timing = timings.part_1 if part == 1 else timings.part_2
+            seconds = 0.0 if part_timing is None else part_timing.wall
+            store.put(day=args.day, part=part, answer=solution, seconds=seconds)
+        if args.command in _SUBMIT_CMDS:
+            from aoc_io import submit_output
+
+            submit_output(day=args.day, part=part, answer=solution)
+    if timings is not None and args.timings:
+        _print_timings(timings.as_dict())
+    if timings is not None and args.memo_stats:
+        _print_memo_stats(type(solution_obj).__module__)
 
 
 def _get_args() -> Namespace:
@@ -67,24 +247,98 @@ def _get_args() -> Namespace:
 
     # Download
     dl_parser = subparsers.add_parser("download", aliases=_DOWNLOAD_CMDS)
-    dl_parser.add_argument("day", type=int, choices=range(1, 26))
+    dl_parser.add_argument("day", choices=[*map(str, range(1, 26)), "all"])
+    dl_parser.add_argument("-f", "--force", action="store_true")
+    dl_parser.add_argument("-j", "--jobs", type=int)
 
     # Print
     print_parser = subparsers.add_parser("print", aliases=_PRINT_CMDS)
     print_parser.add_argument("day", type=int, choices=range(1, 26))
-    print_parser.add_argument("part", type=int, choices=(1, 2))
+    print_parser.add_argument("part", choices=("1", "2", *_BOTH_PARTS))
     print_parser.add_argument("-v", "--visualize", action="store_true")
+    print_parser.add_argument("-t", "--timings", action="store_true")
+    print_parser.add_argument("--parse-cache", action="store_true")
+    print_parser.add_argument("--no-cache", action="store_true")
+    print_parser.add_argument("-i", "--input", type=Path)
+    print_parser.add_argument("--profile", action="store_true")
+    print_parser.add_argument("--mem", action="store_true")
+    print_parser.add_argument("--timeout", type=float)
+    print_parser.add_argument("--memo-stats", action="store_true")
+    print_parser.add_argument("--stream", action="store_true")
 
     # Submit
     submit_parser = subparsers.add_parser("submit", aliases=_SUBMIT_CMDS)
     submit_parser.add_argument("day", type=int, choices=range(1, 26))
     submit_parser.add_argument("part", type=int, choices=(1, 2), nargs="?")
     submit_parser.add_argument("-v", "--visualize", action="store_true")
+    submit_parser.add_argument("-t", "--timings", action="store_true")
+    submit_parser.add_argument("--parse-cache", action="store_true")
+    submit_parser.add_argument("--no-cache", action="store_true")
+    submit_parser.add_argument("--timeout", type=float)
+    submit_parser.add_argument("--memo-stats", action="store_true")
+    submit_parser.add_argument("--stream", action="store_true")
 
     # Run method
     method_parser = subparsers.add_parser("method", aliases=_METHOD_CMDS)
     method_parser.add_argument("day", type=int, choices=range(1, 26))
     method_parser.add_argument("method")
+    method_parser.add_argument("--parse-cache", action="store_true")
+    method_parser.add_argument("-i", "--input", type=Path)
+
+    # Benchmark
+    bench_parser = subparsers.add_parser("bench", aliases=_BENCH_CMDS)
+    bench_parser.add_argument("day", choices=["all", *map(str, range(1, 26))])
+    bench_parser.add_argument("part", type=int, choices=(1, 2), nargs="?")
+    bench_parser.add_argument("-w", "--warmup", type=int, default=1)
+    bench_parser.add_argument("-r", "--repeat", type=int, default=5)
+    bench_parser.add_argument("-o", "--output", type=Path, default=Path("bench.json"))
+    bench_parser.add_argument("--parse-cache", action="store_true")
+    bench_parser.add_argument("--profile", action="store_true")
+    bench_parser.add_argument("--mem", action="store_true")
+    bench_parser.add_argument("--compare", metavar="REF")
+    bench_parser.add_argument("--threshold", type=float, default=0.1)
+
+    # Update performance stats
+    stats_parser = subparsers.add_parser("stats", aliases=_STATS_CMDS)
+    stats_parser.add_argument("-w", "--warmup", type=int, default=1)
+    stats_parser.add_argument("-r", "--repeat", type=int, default=5)
+    stats_parser.add_argument("-o", "--output", type=Path)
+
+    # Run all
+    all_parser = subparsers.add_parser("all", aliases=_ALL_CMDS)
+    all_parser.add_argument("-j", "--jobs", type=int)
+    all_parser.add_argument("-e", "--estimates", type=Path, default=Path("bench.json"))
+    all_parser.add_argument("--parse-cache", action="store_true")
+
+    # Batch
+    batch_parser = subparsers.add_parser("batch", aliases=_BATCH_CMDS)
+    batch_parser.add_argument("day", type=int, choices=range(1, 26))
+    batch_parser.add_argument("inputs")
+    batch_parser.add_argument("part", type=int, choices=(1, 2), nargs="?")
+    batch_parser.add_argument("-j", "--jobs", type=int)
+    batch_parser.add_argument("-o", "--output", type=Path)
+
+    # Generate input
+    generate_parser = subparsers.add_parser("generate", aliases=_GENERATE_CMDS)
+    generate_parser.add_argument("day", type=int, choices=range(1, 26))
+    generate_parser.add_argument("-n", "--size", type=int, required=True)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("-o", "--output", type=Path)
+
+    # Manage caches
+    cache_parser = subparsers.add_parser("cache", aliases=_CACHE_CMDS)
+    cache_parser.add_argument("action", choices=("prune", "clear"))
+
+    # Serve warm solutions
+    serve_parser = subparsers.add_parser("serve", aliases=_SERVE_CMDS)
+    serve_parser.add_argument("--stop", action="store_true")
+
+    # Get solution from the server
+    client_parser = subparsers.add_parser("client", aliases=_CLIENT_CMDS)
+    client_parser.add_argument("day", type=int, choices=range(1, 26))
+    client_parser.add_argument("part", type=int, choices=(1, 2))
+    client_parser.add_argument("-i", "--input", type=Path)
+    client_parser.add_argument("-t", "--timings", action="store_true")
 
     return parser.parse_args()
 
@@ -105,9 +359,18 @@ def _prepare(day: int) -> None:
             f.write(data)
     print("Base URL: https://adventofcode.com/2023")
     print(f"Day URL: https://adventofcode.com/2023/day/{day}")
+    from aoc_io import download_input
+
     download_input(day=day)
 
 
+def _get_part_label(part: int, parts: list[int]) -> str:
+    """
+    Get the part name to print before a result, if several parts are printed
+    """
+    return f"part {part} " if len(parts) > 1 else ""
+
+
 def _run_method(solution_obj: SolutionAbstract, day: int, method_name: str) -> None:
     method = getattr(solution_obj, method_name)
     if not callable(method):
@@ -116,23 +379,366 @@ def _run_method(solution_obj: SolutionAbstract, day: int, method_name: str) -> N
     print(f"{Fore.GREEN}{result}")
 
 
-def _get_solution_obj(day: int) -> SolutionAbstract:
-    dir_name = f"day_{day:>02}"
-    solution_module = import_module(f"{dir_name}.solution")
-    SolutionClass: type[SolutionAbstract] = getattr(solution_module, "Solution")
-    return SolutionClass()
-
-
-def _get_solution(
-    solution_obj: SolutionAbstract, part: int, *, visualize: bool = False
+def _get_watched_solution(
+    solution_obj: SolutionAbstract,
+    part: int,
+    *,
+    timeout: None | float,
+    profile: bool,
+    visualize: bool,
+) -> None | str | int:
+    """
+    Solve a part, sampling its stack and aborting it if it runs for longer than
+      `timeout` seconds
+    """
+    if timeout is None:
+        if profile:
+            return _get_profiled_solution(solution_obj, part, visualize=visualize)
+        return get_solution(solution_obj, part, visualize=visualize)
+
+    from aoc_profile import PartTimeoutError, StackSampler, time_limit
+
+    sampler = StackSampler()
+    try:
+        with sampler, time_limit(timeout):
+            if profile:
+                return _get_profiled_solution(solution_obj, part, visualize=visualize)
+            return get_solution(solution_obj, part, visualize=visualize)
+    except PartTimeoutError as e:
+        print(f"{Fore.RED}Part {part} aborted: {e}")
+    if sampler.sample_count:
+        print(f"Hottest frames in {sampler.sample_count} samples:")
+        print(f"  {'own':>6}  {'total':>6}  function")
+        for frame_samples in sampler.get_hottest_frames():
+            own = frame_samples.own_count / sampler.sample_count
+            total = frame_samples.total_count / sampler.sample_count
+            print(f"  {own:>6.1%}  {total:>6.1%}  {frame_samples.label}")
+    sys.exit(1)
+
+
+def _get_profiled_solution(
+    solution_obj: SolutionAbstract, part: int, *, visualize: bool
 ) -> None | str | int:
-    match part:
-        case 1:
-            return solution_obj.part_1(visualize=visualize)
-        case 2:
-            return solution_obj.part_2(visualize=visualize)
+    from aoc_profile import PROFILE_DIR, PartProfiler
+
+    profiler = PartProfiler()
+    with profiler.profiling():
+        solution = get_solution(solution_obj, part, visualize=visualize)
+    paths = profiler.write(day=solution_obj.day, part=part, output_dir=PROFILE_DIR)
+    print(f"Profiles written to {', '.join(map(str, paths))}")
+    return solution
+
+
+def _generate(*, day: int, size: int, seed: int, output: None | Path) -> None:
+    if size < 1:
+        raise ValueError(f"{size=} must be at least 1")
+    data = get_generator(day)(size, seed=seed)
+    if output is None:
+        sys.stdout.write(data)
+        return
+    with output.open("w") as f:
+        f.write(data)
+    print(f"{Fore.GREEN}Input written to {output}")
+
+
+def _manage_cache(action: str) -> None:
+    store = AnswerStore()
+    match action:
+        case "prune":
+            evicted_count = store.prune()
+            print(f"{Fore.GREEN}Evicted {evicted_count} stale answers")
+        case "clear":
+            store.clear()
+            shutil.rmtree(CACHE_DIR / "parsed", ignore_errors=True)
+            print(f"{Fore.GREEN}Cleared stored answers and parsed inputs")
         case _:
-            raise ValueError(f"Unknown part number {part}.")
+            raise ValueError(f"Unknown cache action {action}.")
+
+
+def _serve(*, stop: bool) -> None:
+    from aoc_server import SOCKET_PATH, send_request, serve
+
+    if stop:
+        try:
+            send_request({"command": "stop"})
+        except ConnectionError as e:
+            print(f"{Fore.RED}{e}")
+            sys.exit(1)
+        print(f"{Fore.GREEN}Stopped server on {SOCKET_PATH}")
+        return
+    print(f"Serving on {SOCKET_PATH}. Stop with `serve --stop`")
+    serve()
+
+
+def _request_solution(
+    *, day: int, part: int, input_path: None | Path, timings: bool
+) -> None:
+    from aoc_bench import format_seconds
+    from aoc_server import send_request
+
+    if input_path == STDIN_PATH:
+        raise ValueError("The server cannot read the client's standard input.")
+    # The server may run in another directory
+    raw_input_path = None if input_path is None else str(input_path.resolve())
+    start = perf_counter()
+    try:
+        response = send_request(
+            {"day": day, "part": part, "input_path": raw_input_path}
+        )
+    except ConnectionError as e:
+        print(f"{Fore.RED}{e}. Start one with `serve`")
+        sys.exit(1)
+    round_trip = perf_counter() - start
+    if "error" in response:
+        print(f"{Fore.RED}Server failed: {response['error']}")
+        sys.exit(1)
+    solution = response["answer"]
+    if solution is None:
+        print(f"{Fore.RED}No response got. This part may need manual processing.")
+        return
+    if response["parsed"]:
+        print(f"{Fore.CYAN}Input parsed by the server")
+    print(f"{Fore.GREEN}Got solution {solution!r}")
+    if timings:
+        _print_timings(response["timings"])
+        print(f"  {'total':<6} wall {format_seconds(round_trip)} (round trip)")
+
+
+def _print_timings(timings: dict[str, None | dict[str, float]]) -> None:
+    from aoc_bench import format_seconds
+
+    for phase, timing in timings.items():
+        if timing is None:
+            continue
+        wall = format_seconds(timing["wall"])
+        cpu = format_seconds(timing["cpu"])
+        print(f"  {phase:<6} wall {wall}, cpu {cpu}")
+
+
+def _print_memo_stats(module: str) -> None:
+    from utils import get_memo_stats
+
+    memo_stats = get_memo_stats(module)
+    if not memo_stats:
+        print("  No memoized functions")
+    for stats in memo_stats:
+        calls = stats.hits + stats.misses
+        hit_rate = f"{stats.hits / calls:.1%}" if calls else "n/a"
+        maxsize = "unbounded" if stats.maxsize is None else stats.maxsize
+        print(
+            f"  {stats.name.removeprefix(f'{module}.')}: {stats.hits} hits,"
+            f" {stats.misses} misses ({hit_rate}), {stats.size}/{maxsize} cached"
+        )
+
+
+def _print_memory(usages: dict[str, MemoryUsage]) -> None:
+    from aoc_bench import format_bytes
+
+    for phase, usage in usages.items():
+        rss_delta = "n/a" if usage.rss_delta is None else format_bytes(usage.rss_delta)
+        print(
+            f"  {phase:<5} peak {format_bytes(usage.peak)}, "
+            f"retained {format_bytes(usage.retained)}, rss delta {rss_delta}"
+        )
+        for site in usage.top_sites:
+            print(
+                f"    {site.location}: {format_bytes(site.size)} in {site.count} blocks"
+            )
+
+
+def _bench(
+    *,
+    days: list[int],
+    parts: list[int],
+    warmup: int,
+    repeat: int,
+    output: Path,
+    use_parse_cache: bool,
+    profile: bool,
+    track_memory: bool,
+    compare_ref: None | str,
+    threshold: float,
+) -> None:
+    from aoc_bench import (
+        append_history,
+        bench_part,
+        format_stats,
+        get_git_commit,
+        load_history,
+        write_report,
+    )
+    from aoc_profile import PROFILE_DIR, PartProfiler
+
+    compare_commit = None
+    if compare_ref is not None:
+        compare_commit = get_git_commit(compare_ref)
+        if compare_commit is None:
+            raise ValueError(f"Unknown git ref {compare_ref}.")
+    # Loaded before this run is added to it
+    history = load_history()
+    results: list[PartBenchResult] = []
+    for day in days:
+        for part in parts:
+            profiler = PartProfiler() if profile else None
+            result = bench_part(
+                day=day,
+                part=part,
+                warmup=warmup,
+                repeat=repeat,
+                use_parse_cache=use_parse_cache,
+                profiler=profiler,
+                track_memory=track_memory,
+            )
+            results.append(result)
+            print(f"{Fore.GREEN}Day {day:>02} part {part}: {result.answer!r}")
+            for phase in ("read", "parse", "solve"):
+                stats: PhaseStats = getattr(result, phase)
+                print(f"  {phase:<5} wall: {format_stats(stats.wall)}")
+                print(f"  {phase:<5} cpu : {format_stats(stats.cpu)}")
+            if result.memory is not None:
+                _print_memory(result.memory)
+            if profiler is not None:
+                paths = profiler.write(day=day, part=part, output_dir=PROFILE_DIR)
+                print(f"  profiles: {', '.join(map(str, paths))}")
+    write_report(results, output)
+    append_history(results, profiled=profile, parse_cache=use_parse_cache)
+    print(f"{Fore.GREEN}Report written to {output}")
+    if compare_ref is not None and compare_commit is not None:
+        regressed = _print_comparison(
+            results,
+            history=history,
+            ref=compare_ref,
+            commit=compare_commit,
+            parse_cache=use_parse_cache,
+            threshold=threshold,
+        )
+        if regressed:
+            sys.exit(1)
+
+
+def _update_stats(*, warmup: int, repeat: int, output: None | Path) -> None:
+    from aoc_bench import (
+        STATS_PATH,
+        bench_part,
+        format_performance_section,
+        format_seconds,
+        get_benchable_days,
+        get_git_commit,
+        is_git_dirty,
+        update_stats_file,
+    )
+
+    results: list[PartBenchResult] = []
+    for day in get_benchable_days():
+        for part in (1, 2):
+            result = bench_part(
+                day=day, part=part, warmup=warmup, repeat=repeat, track_memory=True
+            )
+            results.append(result)
+            print(
+                f"{Fore.GREEN}Day {day:>02} part {part}:"
+                f" {format_seconds(result.solve.wall.median)}"
+            )
+    # Uncommitted changes are not measured at any commit
+    commit = None if is_git_dirty() else get_git_commit()
+    section = format_performance_section(results, commit=commit)
+    path = STATS_PATH if output is None else output
+    update_stats_file(section, path)
+    print(f"{Fore.GREEN}Performance stats written to {path}")
+
+
+def _print_comparison(
+    results: list[PartBenchResult],
+    *,
+    history: list[dict[str, Any]],
+    ref: str,
+    commit: str,
+    parse_cache: bool,
+    threshold: float,
+) -> bool:
+    """
+    Print the change of median times since a commit.
+    Returns:
+        (bool): Whether any phase regressed by more than the threshold
+    """
+    from aoc_bench import compare_to_history, format_seconds
+
+    changes = compare_to_history(
+        results, history=history, commit=commit, parse_cache=parse_cache
+    )
+    print(f"Compared to {ref} ({commit[:12]}):")
+    if not changes:
+        print(f"{Fore.YELLOW}  No history of these parts at {ref}")
+        return False
+    regressed = False
+    for change in changes:
+        message = (
+            f"  Day {change.day:>02} part {change.part} {change.phase:<5}: "
+            f"{format_seconds(change.baseline)} -> {format_seconds(change.current)} "
+            f"({change.ratio - 1:+.1%})"
+        )
+        if change.ratio > 1 + threshold:
+            regressed = True
+            print(f"{Fore.RED}{message} regressed")
+        elif change.ratio < 1 - threshold:
+            print(f"{Fore.GREEN}{message}")
+        else:
+            print(message)
+    return regressed
+
+
+def _run_all(*, jobs: None | int, estimates_path: Path, use_parse_cache: bool) -> None:
+    from aoc_bench import format_seconds, get_benchable_days, load_report_estimates
+    from aoc_pool import run_parts_parallel
+
+    tasks = [(day, part) for day in get_benchable_days() for part in (1, 2)]
+    estimates = load_report_estimates(estimates_path)
+    wall_start = perf_counter()
+    cpu_total = 0.0
+    results = run_parts_parallel(
+        tasks,
+        estimates=estimates,
+        max_workers=jobs,
+        use_parse_cache=use_parse_cache,
+    )
+    for result in results:
+        cpu_total += result.cpu
+        prefix = f"Day {result.day:>02} part {result.part}"
+        took = format_seconds(result.wall)
+        if result.error is not None:
+            print(f"{Fore.RED}{prefix}: failed in {took} ({result.error})")
+        elif result.answer is None:
+            print(f"{Fore.YELLOW}{prefix}: no response in {took}")
+        else:
+            print(f"{Fore.GREEN}{prefix}: {result.answer!r} in {took}")
+    wall_total = perf_counter() - wall_start
+    print(
+        f"Total wall time {format_seconds(wall_total)}, "
+        f"summed CPU time {format_seconds(cpu_total)}"
+    )
+
+
+def _run_batch(
+    *, day: int, inputs: str, parts: list[int], jobs: None | int, output: None | Path
+) -> None:
+    """
+    Solve every input file in a directory or matching a glob pattern, streaming one
+      JSON line per input and part to stdout, or to `output` if given.
+    """
+    from aoc_pool import run_inputs_parallel
+
+    inputs_path = Path(inputs)
+    if inputs_path.is_dir():
+        input_paths = sorted(path for path in inputs_path.iterdir() if path.is_file())
+    else:
+        input_paths = sorted(Path(path) for path in glob(inputs, recursive=True))
+    if not input_paths:
+        raise ValueError(f"No input files found for {inputs}.")
+    results = run_inputs_parallel(day, input_paths, parts=parts, max_workers=jobs)
+    with nullcontext(sys.stdout) if output is None else output.open("w") as f:
+        for result in results:
+            f.write(json.dumps(result.as_dict()) + "\n")
+            f.flush()
 
 
 if __name__ == "__main__":
@@ -2,43 +2,413 @@
 
 from __future__ import annotations
 
+import hashlib
+import mmap
+import os
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
+from time import perf_counter, process_time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, ClassVar
+    from collections.abc import Callable, Iterator
+    from functools import _lru_cache_wrapper
+    from typing import Any, BinaryIO, ClassVar, Literal, Self
+
+    type _Phase = Literal["read", "parse", "part_1", "part_2"]
+
+_ROOT_DIR = Path(__file__).resolve().parent
+
+CACHE_DIR = _ROOT_DIR / ".cache"
+
+# Input path that stands for standard input
+STDIN_PATH = Path("-")
+
+# Modules outside of the day directories whose classes may end up in parsed state
+_SHARED_SOURCE_PATHS = [Path(__file__).resolve(), _ROOT_DIR / "grid.py"]
+
+# Attributes that are never stored in the parsed-input cache
+_UNCACHED_ATTRS = {"raw_data", "timings", "parsed_from_cache", "_input_buffer"}
+
+_DEFAULT_MEMO_SIZE = 4096
+
+
+@dataclass(frozen=True, kw_only=True)
+class PhaseTiming:
+    """
+    Time spent in one phase of a solution run, in seconds
+    """
+
+    wall: float
+    cpu: float
+
+
+@dataclass(kw_only=True)
+class PhaseTimings:
+    """
+    Timings of each phase of a solution run. Phases that have not been run are `None`
+    """
+
+    read: None | PhaseTiming = None
+    parse: None | PhaseTiming = None
+    part_1: None | PhaseTiming = None
+    part_2: None | PhaseTiming = None
+
+    def as_dict(self) -> dict[str, None | dict[str, float]]:
+        return asdict(self)
+
+    @contextmanager
+    def measure(self, phase: _Phase) -> Iterator[None]:
+        """
+        Record the time spent in the `with` block as the timing of `phase`
+        """
+        wall_start = perf_counter()
+        cpu_start = process_time()
+        try:
+            yield
+        finally:
+            timing = PhaseTiming(
+                wall=perf_counter() - wall_start, cpu=process_time() - cpu_start
+            )
+            setattr(self, phase, timing)
+
+
+class InputBuffer:
+    """
+    Read-only bytes of an input file, memory-mapped so that the file is never copied
+      into Python objects as a whole. Trailing newlines are excluded.
+
+    Lines are `memoryview` slices into the buffer. They must be released (or copied
+      with `bytes()`) before the buffer is closed.
+    """
+
+    _file: None | BinaryIO
+    _data: mmap.mmap | bytes
+    _end: int
+    view: memoryview
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._data = b""
+        self._init_view()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Wrap bytes that are already in memory, e.g. read from a pipe.
+        """
+        buffer = cls.__new__(cls)
+        buffer._file = None
+        buffer._data = data
+        buffer._init_view()
+        return buffer
+
+    def _init_view(self) -> None:
+        end = len(self._data)
+        while end and self._data[end - 1] in b"\r\n":
+            end -= 1
+        self._end = end
+        self.view = memoryview(self._data)[:end]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: None | type[BaseException], *_: object) -> None:
+        self.close(strict=exc_type is None)
+
+    def close(self, *, strict: bool = True) -> None:
+        """
+        Unmap and close the input file.
+        Args:
+            strict (bool): Whether to raise if lines are still referenced. Otherwise
+                             the mapping is left to be unmapped once they are released,
+                             e.g. when the frames of an exception hold them
+        Raises:
+            RuntimeError: If lines of the buffer are still referenced, when strict
+        """
+        self.view.release()
+        try:
+            if isinstance(self._data, mmap.mmap):
+                try:
+                    self._data.close()
+                except BufferError as err:
+                    if not strict:
+                        return
+                    raise RuntimeError(
+                        "Lines of the input buffer are still referenced. Copy the"
+                        " lines to keep with `bytes()`"
+                    ) from err
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+    def iter_lines(self) -> Iterator[memoryview]:
+        """
+        Lazily iterate through lines, without line endings.
+        """
+        data = self._data
+        view = self.view
+        end = self._end
+        start = 0
+        while start < end:
+            newline = data.find(b"\n", start, end)
+            if newline == -1:
+                newline = end
+            line_end = newline
+            if line_end > start and data[line_end - 1] == ord("\r"):
+                line_end -= 1
+            yield view[start:line_end]
+            start = newline + 1
+
+
+@dataclass(frozen=True, kw_only=True)
+class MemoStats:
+    """
+    Attributes:
+        name    (str)       : Module and qualified name of the memoized function
+        hits    (int)       : Number of calls answered from the cache
+        misses  (int)       : Number of calls that ran the function
+        size    (int)       : Number of results in the cache
+        maxsize (None | int): Maximum number of results in the cache, if bounded
+    """
+
+    name: str
+    hits: int
+    misses: int
+    size: int
+    maxsize: None | int
+
+
+_MEMOIZED_FUNCTIONS: list[_lru_cache_wrapper[Any]] = []
+
+
+def memoize[**P, R](
+    maxsize: None | int = _DEFAULT_MEMO_SIZE,
+) -> Callable[[Callable[P, R]], _lru_cache_wrapper[R]]:
+    """
+    Decorate a function to memoize its results in a least-recently-used cache of
+      bounded size. Like `functools.cache`, it can also decorate methods, static
+      methods and class methods, in which case the instance or class is part of the
+      key. Memoized functions are registered, so that their caches can be inspected and
+      cleared per module, e.g. between inputs.
+    Args:
+        maxsize (None | int): Maximum number of results kept, evicting the least
+                                recently used first. `None` keeps all results
+    Returns:
+        (Callable): Decorator
+    """
+
+    def decorator(func: Callable[P, R]) -> _lru_cache_wrapper[R]:
+        memoized = lru_cache(maxsize=maxsize)(func)
+        _MEMOIZED_FUNCTIONS.append(memoized)
+        return memoized
+
+    return decorator
+
+
+def get_memo_stats(module: None | str = None) -> list[MemoStats]:
+    """
+    Get the cache statistics of memoized functions.
+    Args:
+        module (None | str): Name of the module to get statistics of. `None` for all
+    Returns:
+        (list[MemoStats]): Statistics in the order the functions were defined
+    """
+    memo_stats: list[MemoStats] = []
+    for memoized in _MEMOIZED_FUNCTIONS:
+        if module is not None and memoized.__module__ != module:
+            continue
+        info = memoized.cache_info()
+        memo_stats.append(
+            MemoStats(
+                name=f"{memoized.__module__}.{memoized.__qualname__}",
+                hits=info.hits,
+                misses=info.misses,
+                size=info.currsize,
+                maxsize=info.maxsize,
+            )
+        )
+    return memo_stats
+
+
+def clear_memo_caches(module: None | str = None) -> None:
+    """
+    Clear the caches of memoized functions.
+    Args:
+        module (None | str): Name of the module to clear caches of. `None` for all
+    """
+    for memoized in _MEMOIZED_FUNCTIONS:
+        if module is None or memoized.__module__ == module:
+            memoized.cache_clear()
 
 
 class SolutionAbstract(ABC):
+    """
+    Solutions process the input from `raw_data` in `_process_data`, unless
+      `use_input_buffer` is set, in which case `raw_data` is never built and the input
+      is processed from an `InputBuffer` in `_process_buffer`.
+
+    Attributes:
+        raw_data (list[str]):
+            Lines of the input, with trailing empty lines removed
+        timings (PhaseTimings):
+            Timings of reading, parsing and running each part
+        parsed_from_cache (bool):
+            Whether the processed data was loaded from the parsed-input cache instead
+            of running `_process_data`
+    """
+
     day: ClassVar[int]
+    use_input_buffer: ClassVar[bool] = False
     raw_data: list[str]
+    timings: PhaseTimings
+    parsed_from_cache: bool
+    _input_path: None | Path
+    _input_buffer: InputBuffer
 
-    def __init__(self) -> None:
-        self.raw_data = self._get_raw_data()
-        self._process_data(self.raw_data)
+    def __init__(
+        self, *, input_path: None | Path = None, use_parse_cache: bool = False
+    ) -> None:
+        """
+        Args:
+            input_path (None | pathlib.Path):
+                Path to read the input from instead of the day's `input.txt`.
+                `STDIN_PATH` reads from standard input
+            use_parse_cache (bool):
+                Whether to load the processed data from the parsed-input cache, and to
+                store it there when missing. The cache is keyed by the hashes of the
+                input file and the solution sources. Ignored for standard input
+        """
+        self._input_path = input_path
+        self.timings = PhaseTimings()
+        self.parsed_from_cache = False
+        # Results memoized for another input are not reused
+        clear_memo_caches(type(self).__module__)
+        with self.timings.measure("read"):
+            self._read_input()
+        is_parsed = False
+        try:
+            with self.timings.measure("parse"):
+                if use_parse_cache and input_path != STDIN_PATH:
+                    self._process_input_with_cache()
+                else:
+                    self._process_input()
+            is_parsed = True
+        finally:
+            if self.use_input_buffer:
+                # Lines held by the frames of a parse error must not hide the error
+                self._input_buffer.close(strict=is_parsed)
+                del self._input_buffer
 
     def __init_subclass__(cls, *, day: int, **kwargs: Any) -> None:
         cls.day = day
         super().__init_subclass__(**kwargs)
 
     def _get_input_path(self) -> Path:
+        if self._input_path is not None:
+            return self._input_path
         return get_input_path(self.day)
 
     def _get_raw_data(self) -> list[str]:
         path = self._get_input_path()
-        with path.open("r") as f:
-            lines = [line.strip("\r\n") for line in f.readlines()]
+        if path == STDIN_PATH:
+            lines = [line.strip("\r\n") for line in sys.stdin]
+        else:
+            with path.open("r") as f:
+                lines = [line.strip("\r\n") for line in f.readlines()]
         # Remove trailing empty lines
         while not lines[-1]:
             lines.pop()
         return lines
 
+    def _read_input(self) -> None:
+        if not self.use_input_buffer:
+            self.raw_data = self._get_raw_data()
+        elif (path := self._get_input_path()) == STDIN_PATH:
+            # Pipes cannot be memory-mapped
+            self._input_buffer = InputBuffer.from_bytes(sys.stdin.buffer.read())
+        else:
+            self._input_buffer = InputBuffer(path)
+
+    def _process_input(self) -> None:
+        if self.use_input_buffer:
+            self._process_buffer(self._input_buffer)
+        else:
+            self._process_data(self.raw_data)
+
     def _process_data(self, raw_data: list[str]) -> None:
         """
         Process input data.
         """
 
+    def _process_buffer(self, buffer: InputBuffer) -> None:
+        """
+        Process input data from a buffer. Used instead of `_process_data` when
+          `use_input_buffer` is set.
+        """
+        raise NotImplementedError()
+
+    def _process_input_with_cache(self) -> None:
+        # Only needed with the parsed-input cache, so not imported on every solve
+        import pickle
+        import tempfile
+        import warnings
+
+        cache_dir = CACHE_DIR / "parsed" / f"day_{self.day:>02}"
+        input_hash = get_input_hash(self._get_input_path())
+        source_hash = get_source_hash(self.day)
+        # Solution classes of a day, e.g. streaming ones, keep different attributes
+        class_name = type(self).__qualname__
+        cache_path = (
+            cache_dir / f"{class_name}-{input_hash[:16]}-{source_hash[:16]}.pickle"
+        )
+        with suppress(
+            FileNotFoundError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+        ):
+            with cache_path.open("rb") as f:
+                state: dict[str, Any] = pickle.load(f)
+            self.__dict__.update(state)
+            self.parsed_from_cache = True
+            return
+
+        self._process_input()
+        state = {k: v for k, v in vars(self).items() if k not in _UNCACHED_ATTRS}
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            warnings.warn(f"Cannot cache day {self.day} parsed data: {err}")
+            return
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Entries with other keys are stale
+            for stale_path in cache_dir.glob(f"{class_name}-*.pickle"):
+                if stale_path != cache_path:
+                    stale_path.unlink(missing_ok=True)
+            # Parts may be solved in parallel, so each writer needs a file of its own
+            fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                tmp_path.replace(cache_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as err:
+            warnings.warn(f"Cannot cache day {self.day} parsed data: {err}")
+
     @abstractmethod
     def part_1(self, *, visualize: bool = False) -> Any:
         """
@@ -53,6 +423,20 @@ class SolutionAbstract(ABC):
         """
         raise NotImplementedError()
 
+    def run_part(self, part: int, *, visualize: bool = False) -> Any:
+        """
+        Run one part of the solution, recording its timing.
+        """
+        match part:
+            case 1:
+                with self.timings.measure("part_1"):
+                    return self.part_1(visualize=visualize)
+            case 2:
+                with self.timings.measure("part_2"):
+                    return self.part_2(visualize=visualize)
+            case _:
+                raise ValueError(f"Unknown part number {part}.")
+
 
 def get_input_path(day: int) -> Path:
     """
@@ -62,6 +446,118 @@ def get_input_path(day: int) -> Path:
     Returns:
         (pathlib.Path): Path of the input data file
     """
+    return get_day_dir(day) / "input.txt"
+
+
+def get_input_hash(path: Path) -> str:
+    """
+    Get the SHA-256 hex digest of an input file.
+    Args:
+        path (pathlib.Path): Path of the input file
+    Returns:
+        (str): Hex digest of the file content
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def get_source_hash(day: int) -> str:
+    """
+    Get the SHA-256 hex digest of a day's solution sources, i.e. all Python files in the
+      day's directory and the shared modules solutions are built on.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (str): Hex digest of the sources
+    """
+    day_dir = get_day_dir(day)
+    source_paths = sorted(day_dir.rglob("*.py")) + _SHARED_SOURCE_PATHS
+    hasher = hashlib.sha256()
+    for source_path in source_paths:
+        hasher.update(source_path.relative_to(_ROOT_DIR).as_posix().encode())
+        hasher.update(source_path.read_bytes())
+    return hasher.hexdigest()
+
+
+def get_day_dir(day: int) -> Path:
+    """
+    Get the directory of a day's solution.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (pathlib.Path): Path of the day's directory
+    """
     if day not in range(1, 26):
         raise ValueError(f"Invalid day number {day}.")
-    return Path(__file__).resolve().parent / f"day_{day:>02}" / "input.txt"
+    return _ROOT_DIR / f"day_{day:>02}"
+
+
+def get_solution_class(day: int, *, streaming: bool = False) -> type[SolutionAbstract]:
+    """
+    Import a day's solution module and get its solution class.
+    Args:
+        day       (1..25): The day of AOC
+        streaming (bool) : Whether to get the day's `StreamingSolution`, which
+                             processes the input as it is read instead of holding it
+    Returns:
+        (type[SolutionAbstract]): Solution class of the day
+    """
+    solution_module = import_module(f"{get_day_dir(day).name}.solution")
+    if not streaming:
+        return getattr(solution_module, "Solution")
+    try:
+        return getattr(solution_module, "StreamingSolution")
+    except AttributeError as err:
+        raise ValueError(f"Day {day} has no streaming solution.") from err
+
+
+def get_generator(day: int) -> Callable[..., str]:
+    """
+    Import a day's input generator module and get its generator function.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (Callable[..., str]): `generate(size, *, seed=0)` of the day, which returns a
+                                random input of the given size
+    """
+    generator_module = import_module(f"{get_day_dir(day).name}.generator")
+    return getattr(generator_module, "generate")
+
+
+def get_solution_obj(
+    day: int,
+    *,
+    input_path: None | Path = None,
+    use_parse_cache: bool = False,
+    streaming: bool = False,
+) -> SolutionAbstract:
+    """
+    Import a day's solution module and construct its solution object.
+    Args:
+        day             (1..25)             : The day of AOC
+        input_path      (None | pathlib.Path): Path to read the input from instead of
+                                               the day's `input.txt`. `STDIN_PATH`
+                                               reads from standard input
+        use_parse_cache (bool)               : Whether to use the parsed-input cache
+        streaming       (bool)               : Whether to use the day's streaming
+                                               solution
+    Returns:
+        (SolutionAbstract): Solution object with input data processed
+    """
+    SolutionClass = get_solution_class(day, streaming=streaming)
+    return SolutionClass(input_path=input_path, use_parse_cache=use_parse_cache)
+
+
+def get_solution(
+    solution_obj: SolutionAbstract, part: int, *, visualize: bool = False
+) -> None | str | int:
+    """
+    Run one part of a solution.
+    Args:
+        solution_obj (SolutionAbstract): Solution object to run
+        part         (1, 2)            : Part number to run
+        visualize    (bool)            : Whether to generate visualizations
+    Returns:
+        (None | str | int): Answer of the part, if any
+    """
+    return solution_obj.run_part(part, visualize=visualize)